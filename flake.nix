@@ -44,6 +44,8 @@
           php
           gnumake
           sysbench
+          numactl
+          util-linux
           python3
         ];
 
@@ -8,11 +8,11 @@ from abc import ABC
 from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, ClassVar, cast
 
+from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
 from ..utils import check_requirements, read_command_version
 
 
 if TYPE_CHECKING:
-    from ..models import BenchmarkResult
     from .types import BenchmarkType
 
 
@@ -23,6 +23,12 @@ class BenchmarkBase(ABC):
     description: str
     version_command: ClassVar[tuple[str, ...] | None] = None
     _required_commands: ClassVar[Sequence[str] | None] = None
+    # Device the benchmark saturates ("cpu" covers host CPU and memory bandwidth, plus "disk" and "gpu");
+    # with --concurrent, benchmarks on different devices may overlap. None always runs alone.
+    concurrency_group: ClassVar[str | None] = None
+    # Key into utils.SHARED_INPUT_RELEASERS for a scratch input reused across benchmarks; the CLI frees it
+    # once the last benchmark naming it has run.
+    shared_input: ClassVar[str | None] = None
 
     @property
     def name(self) -> str:
@@ -88,6 +94,32 @@ class BenchmarkBase(ABC):
             return check_method(args)
         return True, ""
 
+    def build_result(
+        self,
+        *,
+        status: str,
+        metrics: BenchmarkMetrics,
+        parameters: BenchmarkParameters,
+        duration_seconds: float = 0.0,
+        command: str = "",
+        raw_output: str = "",
+        message: str = "",
+        version: str = "",
+    ) -> BenchmarkResult:
+        """Build a result for this benchmark; the runner attaches presets afterwards."""
+        return BenchmarkResult(
+            benchmark_type=self.benchmark_type,
+            status=status,
+            presets=(),
+            metrics=metrics,
+            parameters=parameters,
+            duration_seconds=duration_seconds,
+            command=command,
+            message=message,
+            raw_output=raw_output,
+            version=version,
+        )
+
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         """Execute the benchmark."""
         raise NotImplementedError(f"{self.__class__.__name__} must implement execute()")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import re
 import subprocess
@@ -14,19 +15,28 @@ from .types import BenchmarkType
 
 DEFAULT_SIZE_MB = 512
 DEFAULT_RAM_MB = 256
+VERSION_PATTERN = re.compile(r"([0-9]+(?:\.[0-9]+)+)")
+
+
+@functools.cache
+def _bonnie_version() -> str:
+    """Parse the bonnie++ version once per process."""
+    try:
+        stdout, _, _ = run_command(["bonnie++", "-V"])
+    except FileNotFoundError:
+        return ""
+    match = VERSION_PATTERN.search(stdout)
+    return match.group(1) if match else ""
 
 
 class BonnieBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.BONNIE
     description = "Bonnie++ filesystem benchmark"
     _required_commands = ("bonnie++",)
+    concurrency_group = "disk"
 
     def get_version(self) -> str:
-        stdout, _, _ = run_command(["bonnie++", "-V"])
-        match = re.search(r"([0-9]+(?:\.[0-9]+)+)", stdout)
-        if match:
-            return match.group(1)
-        return super().get_version()
+        return _bonnie_version() or super().get_version()
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         uid = os.getuid()
@@ -54,9 +64,10 @@ class BonnieBenchmark(BenchmarkBase):
         status = "ok"
         message = ""
 
-        csv_lines = [line for line in stdout.splitlines() if line.count(",") > 10]
-        if csv_lines:
-            fields = csv_lines[-1].split(",")
+        # Only the last CSV row is used; bonnie++ writes it at the end, so scan backwards and stop there
+        csv_line = next((line for line in reversed(stdout.splitlines()) if line.count(",") > 10), None)
+        if csv_line is not None:
+            fields = csv_line.split(",")
 
             def parse_float(idx: int, key: str) -> None:
                 if idx >= len(fields):
@@ -76,10 +87,8 @@ class BonnieBenchmark(BenchmarkBase):
             status = "error"
             message = "Unable to parse bonnie++ output"
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=BenchmarkMetrics(metrics_data),
             parameters=BenchmarkParameters(
                 {"size_mb": DEFAULT_SIZE_MB, "ram_mb": DEFAULT_RAM_MB, "iterations": 1, "uid": uid}
@@ -14,6 +14,7 @@ class CLPeakBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.CLPEAK
     description = "OpenCL peak bandwidth/compute"
     _required_commands = ("clpeak",)
+    concurrency_group = "gpu"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         command = ["clpeak"]
@@ -30,10 +31,8 @@ class CLPeakBenchmark(BenchmarkBase):
             metrics = BenchmarkMetrics({})
             message = str(e)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({}),
             duration_seconds=duration,
@@ -14,6 +14,7 @@ class CryptsetupBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.CRYPTSETUP
     description = "cryptsetup cipher benchmark"
     _required_commands = ("cryptsetup",)
+    concurrency_group = "cpu"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         command = ["cryptsetup", "benchmark"]
@@ -49,10 +50,8 @@ class CryptsetupBenchmark(BenchmarkBase):
             metrics = BenchmarkMetrics({})
             message = str(e)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({}),
             duration_seconds=duration,
@@ -1,50 +1,104 @@
 from __future__ import annotations
 
 import argparse
-import re
+import contextlib
+import functools
 import subprocess
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
-from ..utils import run_command
+from ..utils import run_command, run_command_tail
 from .base import BenchmarkBase
 from .types import BenchmarkType
 
 
 DEFAULT_FFMPEG_RESOLUTION = "1280x720"
 DEFAULT_FFMPEG_DURATION = 15  # Increased from 5 for more stable measurements
-DEFAULT_FFMPEG_CODEC = "libx264"
+DEFAULT_FFMPEG_CODEC = "libx264"  # "auto" picks the first hardware encoder ffmpeg reports
+HW_ENCODER_PRIORITY = ("h264_nvenc", "h264_vaapi", "h264_qsv")
+# Global options placed before the input, and output options replacing the default "-preset medium"
+ENCODER_INPUT_ARGS = {"h264_vaapi": ("-vaapi_device", "/dev/dri/renderD128")}
+ENCODER_OUTPUT_ARGS = {
+    "h264_vaapi": ("-vf", "format=nv12,hwupload"),
+    "h264_qsv": ("-vf", "format=nv12", "-preset", "medium"),
+}
+
+
+@functools.cache
+def _available_encoders() -> frozenset[str]:
+    """Probe once which encoders the installed ffmpeg was built with."""
+    stdout, _, returncode = run_command(["ffmpeg", "-hide_banner", "-encoders"])
+    if returncode != 0:
+        return frozenset()
+    encoders = set()
+    for line in stdout.splitlines():
+        parts = line.split()
+        # Encoder rows look like " V....D libx264  description"
+        if len(parts) >= 2 and len(parts[0]) == 6 and parts[0][0] == "V":
+            encoders.add(parts[1])
+    return frozenset(encoders)
+
+
+def _final_progress_block(output: str) -> dict[str, str]:
+    """Return the key=value pairs of the last block ffmpeg wrote with -progress."""
+    end = output.rfind("progress=")
+    if end < 0:
+        return {}
+    previous = output.rfind("progress=", 0, end)
+    start = output.find("\n", previous) + 1 if previous >= 0 else 0
+    block: dict[str, str] = {}
+    for line in output[start:end].splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            block[key.strip()] = value.strip()
+    return block
+
+
+def _resolve_encoder(codec: str) -> str:
+    """Map "auto" to the preferred available hardware encoder, falling back to libx264."""
+    if codec != "auto":
+        return codec
+    encoders = _available_encoders()
+    for encoder in HW_ENCODER_PRIORITY:
+        if encoder in encoders:
+            return encoder
+    return "libx264"
 
 
 class FFmpegBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.FFMPEG_TRANSCODE
     description = "FFmpeg synthetic video transcode"
     _required_commands = ("ffmpeg",)
+    concurrency_group = "cpu"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         resolution = DEFAULT_FFMPEG_RESOLUTION
         duration_secs = DEFAULT_FFMPEG_DURATION
-        codec = DEFAULT_FFMPEG_CODEC
+        codec = args.ffmpeg_codec
+        encoder = _resolve_encoder(codec)
 
         command = [
             "ffmpeg",
             "-hide_banner",
             "-loglevel",
             "error",
-            "-stats",
+            # Machine-readable key=value progress blocks instead of the redrawn stats line
+            "-nostats",
+            "-progress",
+            "pipe:1",
             "-benchmark",
+            *ENCODER_INPUT_ARGS.get(encoder, ()),
             "-f",
             "lavfi",
             "-i",
             f"testsrc=size={resolution}:rate=30:duration={duration_secs}",
             "-c:v",
-            codec,
-            "-preset",
-            "medium",
+            encoder,
+            *ENCODER_OUTPUT_ARGS.get(encoder, ("-preset", "medium")),
             "-f",
             "null",
             "-",
         ]
-        stdout, duration, returncode = run_command(command)
+        stdout, duration, returncode = run_command_tail(command)
         if returncode != 0:
             raise subprocess.CalledProcessError(returncode, command, stdout)
 
@@ -52,13 +106,12 @@ class FFmpegBenchmark(BenchmarkBase):
             metrics_data: dict[str, float | str | int] = {}
             reported_fps: float | None = None
             speed_factor: float | None = None
-            fps_matches = re.findall(r"fps=\s*([\d.]+)", stdout)
-            speed_matches = re.findall(r"speed=\s*([\d.]+)x", stdout)
-            if fps_matches:
-                reported_fps = float(fps_matches[-1])
+            progress = _final_progress_block(stdout)
+            with contextlib.suppress(KeyError, ValueError):
+                reported_fps = float(progress["fps"])
                 metrics_data["reported_fps"] = reported_fps
-            if speed_matches:
-                speed_factor = float(speed_matches[-1])
+            with contextlib.suppress(KeyError, ValueError):
+                speed_factor = float(progress["speed"].rstrip("x"))
                 metrics_data["speed_factor"] = speed_factor
 
             total_frames = duration_secs * 30
@@ -75,6 +128,7 @@ class FFmpegBenchmark(BenchmarkBase):
             if metrics_data:
                 metrics_data["frames"] = total_frames
                 metrics_data["codec"] = codec
+                metrics_data["encoder"] = encoder
 
             if not metrics_data:
                 raise ValueError("Unable to parse FFmpeg output")
@@ -87,16 +141,15 @@ class FFmpegBenchmark(BenchmarkBase):
             metrics = BenchmarkMetrics({})
             message = str(e)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters(
                 {
                     "resolution": resolution,
                     "duration": duration_secs,
                     "codec": codec,
+                    "encoder": encoder,
                 }
             ),
             duration_seconds=duration,
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 import subprocess
-import tempfile
 from pathlib import Path
-from typing import cast
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
 from ..utils import run_command
@@ -16,26 +16,91 @@ from .types import BenchmarkType
 DEFAULT_FIO_SIZE_MB = 256  # Increased from 64 to reduce cache effects
 DEFAULT_FIO_RUNTIME = 5
 DEFAULT_FIO_BLOCK_KB = 1024
+DEFAULT_FIO_IODEPTH = 32
+DEFAULT_FIO_DIRECT = True  # O_DIRECT so reads and writes hit the device rather than the page cache
+
+
+@functools.cache
+def _has_io_uring() -> bool:
+    """Probe once whether io_uring actually works here, not just whether fio was built with it."""
+    # kernel.io_uring_disabled, seccomp and container runtimes can refuse io_uring at runtime, and fixedbufs
+    # needs enough locked memory, so run a tiny job with the same engine options against /dev/null
+    command = [
+        "fio",
+        "--name=io_uring-probe",
+        "--ioengine=io_uring",
+        "--registerfiles",
+        "--fixedbufs",
+        "--filename=/dev/null",
+        "--rw=write",
+        "--bs=4k",
+        "--size=4k",
+        "--output-format=terse",
+    ]
+    _, _, returncode = run_command(command, capture_stdout=False)
+    return returncode == 0
+
+
+def _engine_options(depth: int) -> tuple[str, str]:
+    """Return the ioengine name and its [global] job lines, falling back to psync without io_uring."""
+    if _has_io_uring():
+        return "io_uring", f"ioengine=io_uring\niodepth={depth}\nregisterfiles=1\nfixedbufs=1\n"
+    return "psync", "ioengine=psync\n"
+
+
+def _load_fio_json(stdout: str) -> dict:
+    """Decode fio's JSON report, skipping any notices printed before it on the merged stream."""
+    start = stdout.find("{")
+    if start < 0:
+        raise ValueError("fio output missing JSON report")
+    data, _ = json.JSONDecoder().raw_decode(stdout, start)
+    return data
+
+
+def _job_sections(mixed: bool) -> str:
+    """Job sections for a fused read/write job or explicit write-then-read phases."""
+    if mixed:
+        return "[seqmix]\nrw=readwrite\nrwmixread=50\n"
+    return "[seqwrite]\nrw=write\n\n[seqread]\nstonewall=1\nrw=read\n"
+
+
+def _direction_stats(jobs: list[dict], direction: str) -> dict:
+    """Return stats for the first job that performed I/O in the given direction."""
+    for job in jobs:
+        stats = job.get(direction, {})
+        if stats.get("io_bytes", 0) or stats.get("bw", 0):
+            return stats
+    return {}
 
 
 class FIOBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.FIO_SEQ
     description = "fio sequential read/write"
     _required_commands = ("fio",)
+    concurrency_group = "disk"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         size_mb = DEFAULT_FIO_SIZE_MB
         runtime = DEFAULT_FIO_RUNTIME
         block_kb = DEFAULT_FIO_BLOCK_KB
-
-        results_dir = Path("results")
-        results_dir.mkdir(parents=True, exist_ok=True)
-        data_file = results_dir / "fio-testfile.bin"
+        depth = DEFAULT_FIO_IODEPTH
+        # Opt-in: a 50/50 rw=readwrite job instead of write then read phases separated by stonewall
+        mixed = args.fio_mixed
+        direct = DEFAULT_FIO_DIRECT
+        ioengine, engine_lines = _engine_options(depth)
+
+        # An explicit directory keeps the test file off whatever filesystem the CWD happens to be on
+        test_dir = Path(args.fio_directory)
+        test_dir.mkdir(parents=True, exist_ok=True)
+        # Per-process file name keeps concurrent invocations from sharing (and deleting) one test file
+        data_file = test_dir / f"nixos-benchmark-fio-{os.getpid()}.bin"
 
         job_text = (
             "[global]\n"
-            "ioengine=sync\n"
-            "direct=0\n"
+            f"{engine_lines}"
+            f"direct={int(direct)}\n"
+            # Count the final flush so write bandwidth is not inflated by dirty page buffering
+            "end_fsync=1\n"
             f"size={size_mb}m\n"
             f"runtime={runtime}\n"
             "time_based=1\n"
@@ -43,24 +108,17 @@ class FIOBenchmark(BenchmarkBase):
             f"bs={block_kb}k\n"
             f"filename={data_file}\n"
             "\n"
-            "[seqwrite]\n"
-            "rw=write\n"
-            "\n"
-            "[seqread]\n"
-            "rw=read\n"
+            f"{_job_sections(mixed)}"
         )
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".fio") as tmp:
-            job_path = Path(tmp.name)
-            tmp.write(job_text.encode("utf-8"))
-
+        # fio reads the job file from stdin when given "-", so no temporary job file is needed
+        command = ["fio", "--output-format=json", "-"]
         try:
-            stdout, duration, returncode = run_command(["fio", "--output-format=json", str(job_path)])
+            stdout, duration, returncode = run_command(command, stdin_text=job_text)
             if returncode != 0:
-                raise subprocess.CalledProcessError(returncode, ["fio", "--output-format=json", str(job_path)], stdout)
-            data = json.loads(stdout)
+                raise subprocess.CalledProcessError(returncode, command, stdout)
+            data = _load_fio_json(stdout)
         finally:
-            job_path.unlink(missing_ok=True)
             if data_file.exists():
                 data_file.unlink()
 
@@ -68,25 +126,35 @@ class FIOBenchmark(BenchmarkBase):
         if not jobs:
             raise ValueError("fio output missing job data")
 
-        aggregate = jobs[0]
-        read_stats = aggregate.get("read", {})
-        write_stats = aggregate.get("write", {})
+        read_stats = _direction_stats(jobs, "read")
+        write_stats = _direction_stats(jobs, "write")
 
-        metrics_data = {
-            "seqwrite_mib_per_s": float(write_stats.get("bw", 0.0)) / 1024,
-            "seqwrite_iops": float(write_stats.get("iops", 0.0)),
-            "seqread_mib_per_s": float(read_stats.get("bw", 0.0)) / 1024,
-            "seqread_iops": float(read_stats.get("iops", 0.0)),
+        # Mixed-mode numbers get their own names so they never compare against sequential results
+        prefix = "mix" if mixed else "seq"
+        metrics_data: dict[str, float | str | int] = {
+            f"{prefix}write_mib_per_s": float(write_stats.get("bw", 0.0)) / 1024,
+            f"{prefix}write_iops": float(write_stats.get("iops", 0.0)),
+            f"{prefix}read_mib_per_s": float(read_stats.get("bw", 0.0)) / 1024,
+            f"{prefix}read_iops": float(read_stats.get("iops", 0.0)),
         }
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status="ok",
-            presets=(),
-            metrics=BenchmarkMetrics(cast(dict[str, float | str | int], metrics_data)),
-            parameters=BenchmarkParameters({"size_mb": size_mb, "runtime_s": runtime, "block_kb": block_kb}),
+            metrics=BenchmarkMetrics(metrics_data),
+            parameters=BenchmarkParameters(
+                {
+                    "size_mb": size_mb,
+                    "runtime_s": runtime,
+                    "block_kb": block_kb,
+                    "ioengine": ioengine,
+                    "iodepth": depth if ioengine == "io_uring" else 1,
+                    "mode": "mixed" if mixed else "sequential",
+                    "direct": direct,
+                    "filepath": str(data_file),
+                }
+            ),
             duration_seconds=duration,
-            command=self.format_command(["fio", "--output-format=json", str(job_path)]),
+            command=self.format_command(command),
             raw_output=stdout,
         )
 
@@ -96,8 +164,9 @@ class FIOBenchmark(BenchmarkBase):
         if status_message:
             return status_message
 
-        read_bw = result.metrics.get("seqread_mib_per_s")
-        write_bw = result.metrics.get("seqwrite_mib_per_s")
-        if read_bw is not None and write_bw is not None:
-            return f"R {read_bw:.1f} / W {write_bw:.1f} MiB/s"
+        for prefix, label in (("seq", ""), ("mix", " (mixed)")):
+            read_bw = result.metrics.get(f"{prefix}read_mib_per_s")
+            write_bw = result.metrics.get(f"{prefix}write_mib_per_s")
+            if read_bw is not None and write_bw is not None:
+                return f"R {read_bw:.1f} / W {write_bw:.1f} MiB/s{label}"
         return ""
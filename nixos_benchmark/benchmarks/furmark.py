@@ -3,7 +3,6 @@ from __future__ import annotations
 import argparse
 import re
 import subprocess
-from typing import cast
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
 from ..utils import run_command
@@ -22,6 +21,7 @@ FPS_FALLBACK_PATTERN = re.compile(r"FPS[^\d]*([\d.]+)", flags=re.IGNORECASE)
 
 class FurmarkBenchmark(BenchmarkBase):
     _required_commands = ("furmark",)
+    concurrency_group = "gpu"
     version_command = ("furmark", "-v")
 
     def __init__(self, demo: str, benchmark_type: BenchmarkType, description: str):
@@ -29,8 +29,8 @@ class FurmarkBenchmark(BenchmarkBase):
         self.benchmark_type = benchmark_type
         self.description = description
 
-    def _parse_metrics(self, output: str) -> dict[str, float | int]:
-        metrics: dict[str, float | int] = {}
+    def _parse_metrics(self, output: str) -> dict[str, float | str | int]:
+        metrics: dict[str, float | str | int] = {}
 
         for pattern in FPS_PATTERNS:
             match = re.search(pattern, output, flags=re.IGNORECASE)
@@ -51,9 +51,10 @@ class FurmarkBenchmark(BenchmarkBase):
             metrics["score"] = float(score_match.group(1))
 
         if "fps_avg" not in metrics:
-            fps_values = [float(match) for match in FPS_FALLBACK_PATTERN.findall(output)]
+            # Only the final reading is reported, so only that one is converted
+            fps_values = FPS_FALLBACK_PATTERN.findall(output)
             if fps_values:
-                metrics["fps_avg"] = fps_values[-1]
+                metrics["fps_avg"] = float(fps_values[-1])
 
         if not metrics:
             raise ValueError("Unable to parse furmark output for FPS/score")
@@ -68,12 +69,10 @@ class FurmarkBenchmark(BenchmarkBase):
             raise subprocess.CalledProcessError(returncode, command_list, stdout)
 
         metrics_data = self._parse_metrics(stdout)
-        metrics = BenchmarkMetrics(cast(dict[str, float | str | int], metrics_data))
+        metrics = BenchmarkMetrics(metrics_data)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status="ok",
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({"demo": self.demo, "profile": "p1080"}),
             duration_seconds=duration,
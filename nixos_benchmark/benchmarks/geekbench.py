@@ -2,32 +2,36 @@ from __future__ import annotations
 
 import argparse
 import re
-import shutil
 import subprocess
+from collections.abc import Iterable
 from urllib import error, request
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
-from ..utils import read_command_version, run_command
+from ..utils import find_command, read_command_version, run_command
 from .base import BenchmarkBase
 from .types import BenchmarkType
 
 
 RESULT_URL_PATTERN = re.compile(r"(https?://browser\.geekbench\.com/\S+)", re.IGNORECASE)
-SCORE_BLOCK_TEMPLATE = (
-    r"<div class=['\"]score['\"]>\s*([\d,]+)\s*</div>\s*<div class=['\"]note['\"]>\s*{label}\s*</div>"
+RESULT_URL_TAIL_CHARS = 2048  # the upload link is printed in the closing lines
+SCORE_BLOCK_PATTERN = re.compile(
+    r"<div class=['\"]score['\"]>\s*([\d,]+)\s*</div>\s*<div class=['\"]note['\"]>\s*([^<]*?)\s*</div>",
+    re.IGNORECASE | re.DOTALL,
 )
 
 
 def _resolve_command() -> str | None:
     """Locate the geekbench binary."""
     for candidate in ("geekbench6", "geekbench"):
-        if shutil.which(candidate):
+        if find_command(candidate):
             return candidate
     return None
 
 
 def _extract_result_url(stdout: str) -> str:
-    match = RESULT_URL_PATTERN.search(stdout)
+    match = RESULT_URL_PATTERN.search(stdout, max(len(stdout) - RESULT_URL_TAIL_CHARS, 0))
+    if not match:
+        match = RESULT_URL_PATTERN.search(stdout)
     return match.group(1) if match else ""
 
 
@@ -43,18 +47,42 @@ def _download_result_page(url: str, timeout: float = 10.0) -> str:
         return ""
 
 
+def _extract_scores_html(text: str, labels: Iterable[str]) -> dict[str, float]:
+    """Index the score blocks of a Geekbench result page by label in a single pass."""
+    wanted = {label.casefold(): label for label in labels}
+    scores: dict[str, float] = {}
+    for match in SCORE_BLOCK_PATTERN.finditer(text):
+        label = wanted.get(" ".join(match.group(2).split()).casefold())
+        if label is not None and label not in scores:
+            scores[label] = float(match.group(1).replace(",", ""))
+    return scores
+
+
 def _parse_score_from_text(text: str, label: str) -> float | None:
-    """Extract a score from Geekbench HTML or plain text output."""
-    html_pattern = re.compile(SCORE_BLOCK_TEMPLATE.format(label=re.escape(label)), re.IGNORECASE | re.DOTALL)
-    match = html_pattern.search(text)
-    if not match:
-        text_pattern = re.compile(rf"{re.escape(label)}\s+([\d,]+)", re.IGNORECASE)
-        match = text_pattern.search(text)
+    """Extract a score from plain text Geekbench output."""
+    match = re.search(rf"{re.escape(label)}\s+([\d,]+)", text, re.IGNORECASE)
     if match:
         return float(match.group(1).replace(",", ""))
     return None
 
 
+def _find_scores(search_spaces: list[str], labels: Iterable[str]) -> dict[str, float]:
+    """Look up each label in the first search space that reports it."""
+    labels = tuple(labels)
+    scores: dict[str, float] = {}
+    for text in search_spaces:
+        indexed = _extract_scores_html(text, labels)
+        for label in labels:
+            if label in scores:
+                continue
+            score = indexed.get(label)
+            if score is None:
+                score = _parse_score_from_text(text, label)
+            if score is not None:
+                scores[label] = score
+    return scores
+
+
 class GeekbenchBase(BenchmarkBase):
     mode_flag: str
     mode_label: str
@@ -105,10 +133,8 @@ class GeekbenchBase(BenchmarkBase):
             status = "error"
             message = "Unable to parse Geekbench scores (requires internet access to fetch results)"
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=BenchmarkMetrics(metrics_data),
             parameters=self.build_parameters(),
             duration_seconds=duration,
@@ -124,6 +150,7 @@ class GeekbenchBenchmark(GeekbenchBase):
     description = "Geekbench 6 CPU benchmark"
     mode_flag = "--cpu"
     mode_label = "cpu"
+    concurrency_group = "cpu"
 
     def _parse_metrics(self, stdout: str) -> tuple[dict[str, float | str | int], str, str]:
         metrics_data: dict[str, float | str | int] = {}
@@ -137,15 +164,9 @@ class GeekbenchBenchmark(GeekbenchBase):
         if result_page:
             search_spaces.insert(0, result_page)
 
-        def find_score(label: str) -> float | None:
-            for text in search_spaces:
-                score = _parse_score_from_text(text, label)
-                if score is not None:
-                    return score
-            return None
-
-        single_score = find_score("Single-Core Score")
-        multi_score = find_score("Multi-Core Score")
+        scores = _find_scores(search_spaces, ("Single-Core Score", "Multi-Core Score"))
+        single_score = scores.get("Single-Core Score")
+        multi_score = scores.get("Multi-Core Score")
 
         if single_score is not None:
             metrics_data["single_core_score"] = single_score
@@ -185,6 +206,7 @@ class GeekbenchGPUBenchmark(GeekbenchBase):
     description = "Geekbench 6 GPU compute benchmark"
     mode_flag = "--compute"
     mode_label = "gpu"
+    concurrency_group = "gpu"
 
     def __init__(
         self,
@@ -233,12 +255,10 @@ class GeekbenchGPUBenchmark(GeekbenchBase):
             "vulkan_score": "Vulkan Score",
             "cuda_score": "CUDA Score",
         }
+        scores_by_label = _find_scores(search_spaces, score_patterns.values())
         for key, label in score_patterns.items():
-            for text in search_spaces:
-                score = _parse_score_from_text(text, label)
-                if score is not None:
-                    metrics_data[key] = score
-                    break
+            if label in scores_by_label:
+                metrics_data[key] = scores_by_label[label]
 
         if not metrics_data:
             status = "error"
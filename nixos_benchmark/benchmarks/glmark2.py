@@ -1,9 +1,7 @@
 from __future__ import annotations
 
 import argparse
-import re
 import subprocess
-from typing import cast
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
 from ..utils import run_command
@@ -12,12 +10,14 @@ from .types import BenchmarkType
 
 
 DEFAULT_GLMARK2_SIZE = "1920x1080"
+SCORE_MARKER = "glmark2 Score:"
 
 
 class GLMark2Benchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.GLMARK2
     description = "glmark2 OpenGL benchmark"
     _required_commands = ("glmark2",)
+    concurrency_group = "gpu"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         size = DEFAULT_GLMARK2_SIZE
@@ -25,33 +25,36 @@ class GLMark2Benchmark(BenchmarkBase):
         command = ["glmark2", "-s", size]
         if offscreen:
             command.append("--off-screen")
+        command_text = self.format_command(command)
 
         stdout, duration, returncode = run_command(command)
         if returncode != 0:
             raise subprocess.CalledProcessError(returncode, command, stdout)
 
         try:
-            score_match = re.search(r"glmark2 Score:\s*(\d+)", stdout)
-            if not score_match:
+            # The score is printed on the final line, so search backwards from the end
+            idx = stdout.rfind(SCORE_MARKER)
+            if idx < 0:
+                raise ValueError("Unable to parse glmark2 score")
+            tokens = stdout[idx + len(SCORE_MARKER) :].split(None, 1)
+            if not tokens or not tokens[0].isdigit():
                 raise ValueError("Unable to parse glmark2 score")
 
-            metrics_data = {"score": float(score_match.group(1))}
+            metrics_data: dict[str, float | str | int] = {"score": float(tokens[0])}
             status = "ok"
-            metrics = BenchmarkMetrics(cast(dict[str, float | str | int], metrics_data))
+            metrics = BenchmarkMetrics(metrics_data)
             message = ""
         except ValueError as e:
             status = "error"
             metrics = BenchmarkMetrics({})
             message = str(e)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({"size": size, "mode": "offscreen" if offscreen else "onscreen"}),
             duration_seconds=duration,
-            command=self.format_command(command),
+            command=command_text,
             raw_output=stdout,
             message=message,
         )
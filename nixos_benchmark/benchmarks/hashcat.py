@@ -20,6 +20,7 @@ class HashcatBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.HASHCAT_GPU
     description = "hashcat GPU hash throughput (MD5)"
     _required_commands = ("hashcat",)
+    concurrency_group = "gpu"
 
     def _availability_check(self, args: argparse.Namespace) -> tuple[bool, str]:
         # Quick device probe; if no backends are found, skip gracefully
@@ -64,10 +65,8 @@ class HashcatBenchmark(BenchmarkBase):
             status = "error"
             message = str(exc)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({"runtime_secs": runtime, "hash_mode": hash_mode}),
             duration_seconds=duration,
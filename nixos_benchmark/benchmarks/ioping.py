@@ -3,7 +3,6 @@ from __future__ import annotations
 import argparse
 import re
 import subprocess
-from typing import cast
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
 from ..utils import run_command
@@ -12,12 +11,29 @@ from .types import BenchmarkType
 
 
 DEFAULT_IOPING_COUNT = 20  # Increased from 5 for better statistics, not too slow
+SUMMARY_PATTERN = re.compile(
+    r"min/avg/max/mdev = ([\d.]+)\s*(\w+)\s*/\s*([\d.]+)\s*(\w+)\s*/"
+    r"\s*([\d.]+)\s*(\w+)\s*/\s*([\d.]+)\s*(\w+)"
+)
+
+
+def to_ms(value: str, unit: str) -> float:
+    """Convert an ioping latency reading to milliseconds."""
+    unit_lower = unit.lower()
+    if unit_lower.startswith("us"):
+        return float(value) / 1000.0
+    if unit_lower.startswith("ms"):
+        return float(value)
+    if unit_lower.startswith("s"):
+        return float(value) * 1000.0
+    raise ValueError(f"Unknown latency unit: {unit}")
 
 
 class IOPingBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.IOPING
     description = "ioping latency probe"
     _required_commands = ("ioping",)
+    concurrency_group = "disk"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         count = DEFAULT_IOPING_COUNT
@@ -27,25 +43,11 @@ class IOPingBenchmark(BenchmarkBase):
             raise subprocess.CalledProcessError(returncode, command, stdout)
 
         try:
-            pattern = (
-                r"min/avg/max/mdev = ([\d.]+)\s*(\w+)\s*/\s*([\d.]+)\s*(\w+)\s*/"
-                r"\s*([\d.]+)\s*(\w+)\s*/\s*([\d.]+)\s*(\w+)"
-            )
-            match = re.search(pattern, stdout)
+            match = SUMMARY_PATTERN.search(stdout)
             if not match:
                 raise ValueError("Unable to parse ioping summary")
 
-            def to_ms(value: str, unit: str) -> float:
-                unit_lower = unit.lower()
-                if unit_lower.startswith("us"):
-                    return float(value) / 1000.0
-                if unit_lower.startswith("ms"):
-                    return float(value)
-                if unit_lower.startswith("s"):
-                    return float(value) * 1000.0
-                raise ValueError(f"Unknown latency unit: {unit}")
-
-            metrics_data = {
+            metrics_data: dict[str, float | str | int] = {
                 "latency_min_ms": to_ms(match.group(1), match.group(2)),
                 "latency_avg_ms": to_ms(match.group(3), match.group(4)),
                 "latency_max_ms": to_ms(match.group(5), match.group(6)),
@@ -53,21 +55,19 @@ class IOPingBenchmark(BenchmarkBase):
                 "requests": count,
             }
             status = "ok"
-            metrics = BenchmarkMetrics(cast(dict[str, float | str | int], metrics_data))
+            metrics = BenchmarkMetrics(metrics_data)
             message = ""
         except ValueError as e:
             status = "error"
             metrics = BenchmarkMetrics({})
             message = str(e)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({"count": count}),
             duration_seconds=duration,
-            command=f"ioping -c {count} .",
+            command=self.format_command(command),
             raw_output=stdout,
             message=message,
         )
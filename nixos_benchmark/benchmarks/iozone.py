@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import re
 import subprocess
 import tempfile
@@ -14,21 +15,32 @@ from .types import BenchmarkType
 
 DEFAULT_FILE_SIZE = "64M"
 DEFAULT_RECORD_SIZE = "1M"
+VERSION_PATTERN = re.compile(r"Version\s+([0-9.]+)")
+REVISION_PATTERN = re.compile(r"Revision[:\s]+([0-9.]+)")
+DATA_LINE_PATTERN = re.compile(r"^[ \t]*\d+[ \t]+\d+[ \t]+\d.*$", flags=re.MULTILINE)
+
+
+@functools.cache
+def _iozone_version() -> str:
+    """Parse the iozone version from its help output once per process."""
+    try:
+        stdout, _, _ = run_command(["iozone", "-h"])
+    except FileNotFoundError:
+        return ""
+    version_match = VERSION_PATTERN.search(stdout)
+    if not version_match:
+        version_match = REVISION_PATTERN.search(stdout)
+    return version_match.group(1) if version_match else ""
 
 
 class IozoneBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.IOZONE
     description = "Iozone sequential and random IO benchmark"
     _required_commands = ("iozone",)
+    concurrency_group = "disk"
 
     def get_version(self) -> str:
-        stdout, _, _ = run_command(["iozone", "-h"])
-        version_match = re.search(r"Version\s+([0-9.]+)", stdout)
-        if not version_match:
-            version_match = re.search(r"Revision[:\s]+([0-9.]+)", stdout)
-        if version_match:
-            return version_match.group(1)
-        return super().get_version()
+        return _iozone_version() or super().get_version()
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -58,7 +70,8 @@ class IozoneBenchmark(BenchmarkBase):
         message = ""
         status = "ok"
 
-        data_line = next((line for line in stdout.splitlines() if re.match(r"\s*\d+\s+\d+\s+\d", line)), None)
+        data_match = DATA_LINE_PATTERN.search(stdout)
+        data_line = data_match.group(0) if data_match else None
         file_kb = 0
         record_kb = 0
         if data_line:
@@ -94,10 +107,8 @@ class IozoneBenchmark(BenchmarkBase):
             status = "error"
             message = "Unable to parse iozone output"
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=BenchmarkMetrics(metrics_data),
             parameters=BenchmarkParameters(
                 {
@@ -13,12 +13,14 @@ from .types import BenchmarkType
 
 
 DEFAULT_JOHN_RUNTIME = 5
+CRACKS_PATTERN = re.compile(r"Raw:\s+([\d.]+)\s+c/s\s+real")
 
 
 class JohnBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.JOHN
     description = "John the Ripper CPU hash benchmark (sha512crypt)"
     _required_commands = ("john",)
+    concurrency_group = "cpu"
     version_command = ("john", "--list=build-info")
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
@@ -32,7 +34,7 @@ class JohnBenchmark(BenchmarkBase):
             raise subprocess.CalledProcessError(returncode, command, stdout)
 
         try:
-            match = re.search(r"Raw:\s+([\d.]+)\s+c/s\s+real", stdout)
+            match = CRACKS_PATTERN.search(stdout)
             if not match:
                 raise ValueError("Unable to parse john benchmark output")
             cps = float(match.group(1))
@@ -44,10 +46,8 @@ class JohnBenchmark(BenchmarkBase):
             status = "error"
             message = str(exc)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({"runtime_secs": runtime, "hash_format": "sha512crypt"}),
             duration_seconds=duration,
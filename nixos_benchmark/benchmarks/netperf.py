@@ -4,79 +4,76 @@ import argparse
 import contextlib
 import re
 import subprocess
-from typing import cast
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
-from ..utils import find_free_tcp_port, run_command, wait_for_port
+from ..utils import find_command, find_free_tcp_port, run_command, stop_process_group, wait_for_port
 from .base import BenchmarkBase
 from .types import BenchmarkType
 
 
 DEFAULT_NETPERF_DURATION = 10  # Increased from 3 to allow TCP to reach steady state
+TRAILING_NUMBER_PATTERN = re.compile(r"([\d.]+)\s*$", flags=re.MULTILINE)
+
+
+def _parse_throughput(stdout: str) -> float:
+    """Read the throughput column from the last line of netperf's result table."""
+    lines = stdout.rstrip().rsplit("\n", 1)
+    with contextlib.suppress(ValueError, IndexError):
+        return float(lines[-1].split()[-1])
+    # Unexpected trailer: fall back to the last number that ends any line
+    values = TRAILING_NUMBER_PATTERN.findall(stdout)
+    if not values:
+        raise ValueError("Unable to parse netperf throughput")
+    return float(values[-1])
 
 
 class NetperfBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.NETPERF
     description = "netperf TCP_STREAM loopback"
     _required_commands = ("netperf", "netserver")
+    concurrency_group = "cpu"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         duration = DEFAULT_NETPERF_DURATION
         port = find_free_tcp_port()
+        # -D keeps netserver in the foreground so the process we terminate is the actual server
         server = subprocess.Popen(
-            ["netserver", "-p", str(port)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            ["netserver", "-D", "-p", str(port)],
+            executable=find_command("netserver"),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
         )
         if not wait_for_port("127.0.0.1", port):
-            server.kill()
+            stop_process_group(server)
             raise RuntimeError("netserver failed to start")
+        command = ["netperf", "-H", "127.0.0.1", "-p", str(port), "-l", str(duration), "-t", "TCP_STREAM"]
         try:
-            stdout, client_duration, _ = run_command(
-                [
-                    "netperf",
-                    "-H",
-                    "127.0.0.1",
-                    "-p",
-                    str(port),
-                    "-l",
-                    str(duration),
-                    "-t",
-                    "TCP_STREAM",
-                ]
-            )
+            stdout, client_duration, _ = run_command(command)
 
             try:
-                values = [float(token) for token in re.findall(r"([\d.]+)\s*$", stdout, flags=re.MULTILINE) if token]
-                if not values:
-                    raise ValueError("Unable to parse netperf throughput")
-                throughput_mbps = values[-1]
-                metrics_data = {
+                throughput_mbps = _parse_throughput(stdout)
+                metrics_data: dict[str, float | str | int] = {
                     "throughput_mbps": throughput_mbps,
                     "duration_s": duration,
                 }
 
                 status = "ok"
-                metrics = BenchmarkMetrics(cast(dict[str, float | str | int], metrics_data))
+                metrics = BenchmarkMetrics(metrics_data)
                 message = ""
             except ValueError as e:
                 status = "error"
                 metrics = BenchmarkMetrics({})
                 message = str(e)
         finally:
-            server.terminate()
-            with contextlib.suppress(Exception):
-                server.wait(timeout=5)
+            stop_process_group(server)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({"duration_s": duration}),
             duration_seconds=client_duration,
-            command=f"netperf -H 127.0.0.1 -p {port} -l {duration} -t TCP_STREAM",
+            command=self.format_command(command),
             raw_output=stdout,
             message=message,
         )
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import argparse
-import os
 import subprocess
+import tempfile
 import time
 from pathlib import Path
-from typing import cast
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
-from ..utils import run_command, write_temp_data_file
+from ..utils import effective_cpu_count, run_command, shared_data_file
 from .base import BenchmarkBase
 from .types import BenchmarkType
 from .zstd import DEFAULT_COMPRESS_SIZE_MB
@@ -21,36 +20,40 @@ class PigzBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.PIGZ
     description = "pigz compress/decompress throughput"
     _required_commands = ("pigz",)
+    concurrency_group = "cpu"
+    shared_input = "compression_data"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         level = DEFAULT_PIGZ_LEVEL
         size_mb = DEFAULT_COMPRESS_SIZE_MB
-        processes = max(os.cpu_count() or 1, 1)
-        data_path = write_temp_data_file(size_mb)
-        compressed_path = Path(f"{data_path}.gz")
-        decompressed_path = compressed_path.with_suffix("")
+        processes = effective_cpu_count()
+        # Shared with zstd, so the input is generated once per run and left in place
+        data_path = shared_data_file(size_mb)
+        staged_path = Path(f"{data_path}.gz")
 
-        try:
-            start = time.perf_counter()
-            compress_command = ["pigz", "-f", "-k", "-p", str(processes), f"-{level}", str(data_path)]
-            stdout, _, returncode = run_command(compress_command)
-            if returncode != 0:
-                raise subprocess.CalledProcessError(returncode, compress_command, stdout)
-            compress_duration = time.perf_counter() - start
+        # Decompress inside a private directory so pigz never writes over the shared input
+        with tempfile.TemporaryDirectory(dir=data_path.parent) as workdir:
+            compressed_path = Path(workdir) / staged_path.name
+            try:
+                start = time.perf_counter()
+                compress_command = ["pigz", "-f", "-k", "-p", str(processes), f"-{level}", str(data_path)]
+                stdout, _, returncode = run_command(compress_command, capture_stdout=False)
+                if returncode != 0:
+                    raise subprocess.CalledProcessError(returncode, compress_command, stdout)
+                compress_duration = time.perf_counter() - start
 
-            data_path.unlink(missing_ok=True)
-            start = time.perf_counter()
-            decompress_command = ["pigz", "-d", "-f", "-k", str(compressed_path)]
-            stdout, _, returncode = run_command(decompress_command)
-            if returncode != 0:
-                raise subprocess.CalledProcessError(returncode, decompress_command, stdout)
-            decompress_duration = time.perf_counter() - start
-        finally:
-            data_path.unlink(missing_ok=True)
-            compressed_path.unlink(missing_ok=True)
-            decompressed_path.unlink(missing_ok=True)
+                staged_path.replace(compressed_path)
+                start = time.perf_counter()
+                # Inflate itself is serial; -p sizes pigz's read/write/check helper threads to the usable CPUs
+                decompress_command = ["pigz", "-d", "-f", "-k", "-p", str(processes), str(compressed_path)]
+                stdout, _, returncode = run_command(decompress_command, capture_stdout=False)
+                if returncode != 0:
+                    raise subprocess.CalledProcessError(returncode, decompress_command, stdout)
+                decompress_duration = time.perf_counter() - start
+            finally:
+                staged_path.unlink(missing_ok=True)
 
-        metrics_data = {
+        metrics_data: dict[str, float | str | int] = {
             "compress_mb_per_s": size_mb / compress_duration if compress_duration else 0.0,
             "decompress_mb_per_s": size_mb / decompress_duration if decompress_duration else 0.0,
             "level": level,
@@ -58,11 +61,9 @@ class PigzBenchmark(BenchmarkBase):
             "processes": processes,
         }
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status="ok",
-            presets=(),
-            metrics=BenchmarkMetrics(cast(dict[str, float | str | int], metrics_data)),
+            metrics=BenchmarkMetrics(metrics_data),
             parameters=BenchmarkParameters({"level": level, "size_mb": size_mb}),
             duration_seconds=compress_duration + decompress_duration,
             command=self.format_command(compress_command),
@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+import functools
+import math
+import statistics
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import SupportsFloat, SupportsIndex
 
 from ..models import BenchmarkMetrics, BenchmarkResult
 from .types import BenchmarkType
 
 
+HASH_RATE_UNITS = ("H/s", "kH/s", "MH/s", "GH/s", "TH/s")
+
+
 def _coerce_number(value: object) -> float | None:
     """Convert arbitrary values to float when possible."""
+    # Metrics are almost always plain numbers; bools are ints too but are kept on the generic path
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if not isinstance(value, (str, bytes, bytearray, SupportsFloat, SupportsIndex)):
+        return None
     try:
-        return float(value)  # type: ignore[arg-type]
+        return float(value)
     except (TypeError, ValueError):
         return None
 
@@ -25,6 +38,16 @@ def _metric_number(metrics: BenchmarkMetrics, key: str, scale: float = 1.0) -> f
     return number * scale
 
 
+def _result_metric_number(key: str, scale: float, result: BenchmarkResult) -> float | None:
+    """Extractor body for ``_scaled_metric``; arguments are ordered for functools.partial."""
+    return _metric_number(result.metrics, key, scale)
+
+
+def _scaled_metric(key: str, scale: float = 1.0) -> Callable[[BenchmarkResult], float | None]:
+    """Build an extractor reading one metric with a scale, without a per-rule closure."""
+    return functools.partial(_result_metric_number, key, scale)
+
+
 def _first_numeric(*values: object) -> float | None:
     """Return the first value that can be coerced to a float."""
     for value in values:
@@ -36,43 +59,39 @@ def _first_numeric(*values: object) -> float | None:
 
 def _max_numeric(values: Iterable[float]) -> float | None:
     """Return max value or None for empty iterables."""
-    numbers = list(values)
-    return max(numbers) if numbers else None
+    return max(values, default=None)
 
 
 def _mean_numeric(values: Iterable[float | None]) -> float | None:
     """Return the arithmetic mean of numeric values, ignoring missing entries."""
     numbers = [value for value in values if value is not None]
-    if not numbers:
-        return None
-    return sum(numbers) / len(numbers)
+    return statistics.fmean(numbers) if numbers else None
 
 
 def _format_hash_rate(hashes_per_sec: float) -> str:
     """Pretty-format a hash rate with dynamic units."""
-    units = ["H/s", "kH/s", "MH/s", "GH/s", "TH/s"]
-    value = hashes_per_sec
-    unit = units[0]
-    for candidate in units[1:]:
-        if value < 1000:
-            break
-        value /= 1000
-        unit = candidate
-    return f"{value:.1f} {unit}"
-
-
-@dataclass(frozen=True)
+    if hashes_per_sec < 1000:
+        return f"{hashes_per_sec:.1f} {HASH_RATE_UNITS[0]}"
+    # One unit step per factor of 1000, capped at the largest unit
+    index = min(int(math.log10(hashes_per_sec)) // 3, len(HASH_RATE_UNITS) - 1)
+    return f"{hashes_per_sec / 1000**index:.1f} {HASH_RATE_UNITS[index]}"
+
+
+@dataclass(frozen=True, slots=True)
 class ScoreRule:
     metric: str
     label: str
     higher_is_better: bool = True
     extractor: Callable[[BenchmarkResult], float | None] | None = None
     formatter: Callable[[float], str] | None = None
+    # Custom extractor or a plain read of ``metric``, resolved once instead of on every extract
+    _resolved_extractor: Callable[[BenchmarkResult], float | None] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_resolved_extractor", self.extractor or _scaled_metric(self.metric))
 
     def extract(self, result: BenchmarkResult) -> float | None:
-        if result.status != "ok":
-            return None
-        return self.extractor(result) if self.extractor else _metric_number(result.metrics, self.metric)
+        return self._resolved_extractor(result) if result.status == "ok" else None
 
     def format_value(self, value: float) -> str:
         if self.formatter:
@@ -82,23 +101,23 @@ class ScoreRule:
 
 CPU_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
     BenchmarkType.OPENSSL_SPEED: ScoreRule(
-        metric="max_kbytes_per_sec",
-        label="AES throughput (MiB/s)",
+        metric="aggregate_max_kbytes_per_sec",
+        label="AES throughput, all cores (MiB/s)",
         higher_is_better=True,
-        extractor=lambda result: _metric_number(result.metrics, "max_kbytes_per_sec", scale=1 / 1024),
-        formatter=lambda value: f"{value:.1f} MiB/s",
+        extractor=_scaled_metric("aggregate_max_kbytes_per_sec", scale=1 / 1024),
+        formatter="{:.1f} MiB/s".format,
     ),
     BenchmarkType.SEVENZIP: ScoreRule(
         metric="total_rating_mips",
         label="Total rating (MIPS)",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.0f} MIPS",
+        formatter="{:,.0f} MIPS".format,
     ),
     BenchmarkType.JOHN: ScoreRule(
         metric="c_per_sec",
         label="Cracks per second",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.0f} c/s",
+        formatter="{:,.0f} c/s".format,
     ),
     BenchmarkType.STOCKFISH: ScoreRule(
         metric="nodes_per_sec",
@@ -110,13 +129,13 @@ CPU_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
         metric="bogo_ops_per_sec_real",
         label="Bogo-ops per second",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.0f} ops/s",
+        formatter="{:,.0f} ops/s".format,
     ),
     BenchmarkType.SYSBENCH_CPU: ScoreRule(
         metric="events_per_sec",
         label="Events per second",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.0f} events/s",
+        formatter="{:,.0f} events/s".format,
     ),
     BenchmarkType.GEEKBENCH: ScoreRule(
         metric="multi_core_score",
@@ -125,37 +144,37 @@ CPU_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
         extractor=lambda result: _first_numeric(
             result.metrics.get("multi_core_score"), result.metrics.get("single_core_score")
         ),
-        formatter=lambda value: f"{value:,.0f} pts",
+        formatter="{:,.0f} pts".format,
     ),
     BenchmarkType.ZSTD: ScoreRule(
         metric="compress_mb_per_s",
         label="Compression throughput (MB/s)",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.0f} MB/s",
+        formatter="{:,.0f} MB/s".format,
     ),
     BenchmarkType.PIGZ: ScoreRule(
         metric="compress_mb_per_s",
         label="Compression throughput (MB/s)",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.0f} MB/s",
+        formatter="{:,.0f} MB/s".format,
     ),
     BenchmarkType.LZ4: ScoreRule(
         metric="compress_mb_per_s",
         label="Compression throughput (MB/s)",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.0f} MB/s",
+        formatter="{:,.0f} MB/s".format,
     ),
     BenchmarkType.X264: ScoreRule(
         metric="fps",
         label="Encoding FPS",
         higher_is_better=True,
-        formatter=lambda value: f"{value:.1f} fps",
+        formatter="{:.1f} fps".format,
     ),
     BenchmarkType.X265: ScoreRule(
         metric="fps",
         label="Encoding FPS",
         higher_is_better=True,
-        formatter=lambda value: f"{value:.1f} fps",
+        formatter="{:.1f} fps".format,
     ),
     BenchmarkType.FFMPEG_TRANSCODE: ScoreRule(
         metric="effective_fps",
@@ -164,7 +183,7 @@ CPU_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
         extractor=lambda result: _first_numeric(
             result.metrics.get("effective_fps"), result.metrics.get("reported_fps")
         ),
-        formatter=lambda value: f"{value:.1f} fps",
+        formatter="{:.1f} fps".format,
     ),
 }
 
@@ -173,35 +192,35 @@ GPU_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
         metric="score",
         label="glmark2 score",
         higher_is_better=True,
-        formatter=lambda value: f"{value:.0f} pts",
+        formatter="{:.0f} pts".format,
     ),
     BenchmarkType.FURMARK_GL: ScoreRule(
         metric="fps_avg",
         label="Average FPS",
         higher_is_better=True,
         extractor=lambda result: _first_numeric(result.metrics.get("fps_avg")),
-        formatter=lambda value: f"{value:.1f} fps",
+        formatter="{:.1f} fps".format,
     ),
     BenchmarkType.FURMARK_VK: ScoreRule(
         metric="fps_avg",
         label="Average FPS",
         higher_is_better=True,
         extractor=lambda result: _first_numeric(result.metrics.get("fps_avg")),
-        formatter=lambda value: f"{value:.1f} fps",
+        formatter="{:.1f} fps".format,
     ),
     BenchmarkType.FURMARK_KNOT_GL: ScoreRule(
         metric="fps_avg",
         label="Average FPS",
         higher_is_better=True,
         extractor=lambda result: _first_numeric(result.metrics.get("fps_avg")),
-        formatter=lambda value: f"{value:.1f} fps",
+        formatter="{:.1f} fps".format,
     ),
     BenchmarkType.FURMARK_KNOT_VK: ScoreRule(
         metric="fps_avg",
         label="Average FPS",
         higher_is_better=True,
         extractor=lambda result: _first_numeric(result.metrics.get("fps_avg")),
-        formatter=lambda value: f"{value:.1f} fps",
+        formatter="{:.1f} fps".format,
     ),
     BenchmarkType.CLPEAK: ScoreRule(
         metric="global_memory_bandwidth_gb_per_s",
@@ -211,7 +230,7 @@ GPU_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
             result.metrics.get("global_memory_bandwidth_gb_per_s"),
             _max_numeric(v for v in result.metrics.data.values() if isinstance(v, (int, float))),
         ),
-        formatter=lambda value: f"{value:.1f} GB/s",
+        formatter="{:.1f} GB/s".format,
     ),
     BenchmarkType.HASHCAT_GPU: ScoreRule(
         metric="hashes_per_sec",
@@ -230,7 +249,7 @@ GPU_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
             result.metrics.get("metal_score"),
             result.metrics.get("cuda_score"),
         ),
-        formatter=lambda value: f"{value:,.0f} pts",
+        formatter="{:,.0f} pts".format,
     ),
     BenchmarkType.GEEKBENCH_GPU_VULKAN: ScoreRule(
         metric="compute_score",
@@ -243,7 +262,7 @@ GPU_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
             result.metrics.get("metal_score"),
             result.metrics.get("cuda_score"),
         ),
-        formatter=lambda value: f"{value:,.0f} pts",
+        formatter="{:,.0f} pts".format,
     ),
 }
 
@@ -258,7 +277,7 @@ IO_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
                 _metric_number(result.metrics, "seqwrite_mib_per_s"),
             ]
         ),
-        formatter=lambda value: f"{value:.1f} MiB/s",
+        formatter="{:.1f} MiB/s".format,
     ),
     BenchmarkType.BONNIE: ScoreRule(
         metric="block_read_mb_s",
@@ -270,13 +289,13 @@ IO_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
                 _first_numeric(result.metrics.get("block_write_mb_s"), result.metrics.get("char_write_mb_s")),
             ]
         ),
-        formatter=lambda value: f"{value:.1f} MiB/s",
+        formatter="{:.1f} MiB/s".format,
     ),
     BenchmarkType.IOPING: ScoreRule(
         metric="latency_avg_ms",
         label="Avg latency (ms)",
         higher_is_better=False,
-        formatter=lambda value: f"{value:.2f} ms",
+        formatter="{:.2f} ms".format,
     ),
     BenchmarkType.CRYPTSETUP: ScoreRule(
         metric="aes-xts_256_enc_mib_per_s",
@@ -285,19 +304,19 @@ IO_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
         extractor=lambda result: _max_numeric(
             v for k, v in result.metrics.data.items() if k.endswith("_enc_mib_per_s") and isinstance(v, (int, float))
         ),
-        formatter=lambda value: f"{value:,.0f} MiB/s",
+        formatter="{:,.0f} MiB/s".format,
     ),
     BenchmarkType.SQLITE_MIXED: ScoreRule(
         metric="insert_rows_per_s",
         label="Insert throughput (rows/s)",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.0f} rows/s",
+        formatter="{:,.0f} rows/s".format,
     ),
     BenchmarkType.SQLITE_SPEEDTEST: ScoreRule(
         metric="insert_rows_per_s",
         label="Insert throughput (rows/s)",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.0f} rows/s",
+        formatter="{:,.0f} rows/s".format,
     ),
     BenchmarkType.IOZONE: ScoreRule(
         metric="read_mb_s",
@@ -311,7 +330,7 @@ IO_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
                 _metric_number(result.metrics, "rewrite_mb_s"),
             ]
         ),
-        formatter=lambda value: f"{value:.1f} MiB/s",
+        formatter="{:.1f} MiB/s".format,
     ),
 }
 
@@ -320,13 +339,13 @@ MEMORY_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
         metric="throughput_mib_per_s",
         label="Memory throughput (MiB/s)",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.0f} MiB/s",
+        formatter="{:,.0f} MiB/s".format,
     ),
     BenchmarkType.STRESSAPPTEST: ScoreRule(
         metric="throughput_mb_per_s",
         label="Memory bandwidth (MB/s)",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.1f} MB/s",
+        formatter="{:,.1f} MB/s".format,
     ),
     BenchmarkType.TINYMEMBENCH: ScoreRule(
         metric="standard_memcpy_mb_per_s",
@@ -337,7 +356,7 @@ MEMORY_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
             result.metrics.get("memcpy_mb_per_s"),
             _max_numeric(v for v in result.metrics.data.values() if isinstance(v, (int, float))),
         ),
-        formatter=lambda value: f"{value:,.0f} MB/s",
+        formatter="{:,.0f} MB/s".format,
     ),
 }
 
@@ -346,23 +365,26 @@ NETWORK_SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
         metric="throughput_mbps",
         label="TCP throughput (Mb/s)",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.1f} Mb/s",
+        formatter="{:,.1f} Mb/s".format,
     ),
     BenchmarkType.WRK_HTTP: ScoreRule(
         metric="requests_per_sec",
         label="HTTP requests/s",
         higher_is_better=True,
-        formatter=lambda value: f"{value:,.0f} req/s",
+        formatter="{:,.0f} req/s".format,
     ),
 }
 
-SCORE_RULES: dict[BenchmarkType, ScoreRule] = {
-    **CPU_SCORE_RULES,
-    **GPU_SCORE_RULES,
-    **IO_SCORE_RULES,
-    **MEMORY_SCORE_RULES,
-    **NETWORK_SCORE_RULES,
-}
+# Read-only merged view of every rule table
+SCORE_RULES: Mapping[BenchmarkType, ScoreRule] = MappingProxyType(
+    {
+        **CPU_SCORE_RULES,
+        **GPU_SCORE_RULES,
+        **IO_SCORE_RULES,
+        **MEMORY_SCORE_RULES,
+        **NETWORK_SCORE_RULES,
+    }
+)
 
 
 def get_score_rule(bench_type: BenchmarkType | None) -> ScoreRule | None:
@@ -10,10 +10,27 @@ from .base import BenchmarkBase
 from .types import BenchmarkType
 
 
+# Tot: and Avr: rows in one alternation, so the summary is found in a single pass
+SUMMARY_PATTERN = re.compile(
+    r"Tot:\s+(?P<tot>[\d.]+\s+[\d.]+\s+[\d.]+)"
+    r"|Avr:\s+(?P<avr>[\d.]+\s+[\d.]+\s+[\d.]+)\s+\|\s+(?P<avr_decompress>[\d.]+\s+[\d.]+\s+[\d.]+)"
+)
+TOTAL_KEYS = ("total_usage_pct", "total_ru", "total_rating_mips")
+AVERAGE_KEYS = (
+    "compress_usage_pct",
+    "compress_ru_mips",
+    "compress_rating_mips",
+    "decompress_usage_pct",
+    "decompress_ru_mips",
+    "decompress_rating_mips",
+)
+
+
 class SevenZipBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.SEVENZIP
     description = "7-Zip compression benchmark"
     _required_commands = ("7z",)
+    concurrency_group = "cpu"
     version_command = ("7z",)
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
@@ -23,25 +40,14 @@ class SevenZipBenchmark(BenchmarkBase):
             raise subprocess.CalledProcessError(returncode, command, stdout)
 
         try:
-            totals_match = re.search(r"Tot:\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)", stdout)
-            avg_match = re.search(
-                r"Avr:\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s+\|\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)",
-                stdout,
-            )
             metrics_data: dict[str, float | str | int] = {}
-
-            if totals_match:
-                metrics_data["total_usage_pct"] = float(totals_match.group(1))
-                metrics_data["total_ru"] = float(totals_match.group(2))
-                metrics_data["total_rating_mips"] = float(totals_match.group(3))
-
-            if avg_match:
-                metrics_data["compress_usage_pct"] = float(avg_match.group(1))
-                metrics_data["compress_ru_mips"] = float(avg_match.group(2))
-                metrics_data["compress_rating_mips"] = float(avg_match.group(3))
-                metrics_data["decompress_usage_pct"] = float(avg_match.group(4))
-                metrics_data["decompress_ru_mips"] = float(avg_match.group(5))
-                metrics_data["decompress_rating_mips"] = float(avg_match.group(6))
+            for match in SUMMARY_PATTERN.finditer(stdout):
+                # Keep the first row of each kind, as 7z prints one of each
+                if match["tot"] and TOTAL_KEYS[0] not in metrics_data:
+                    metrics_data.update(zip(TOTAL_KEYS, map(float, match["tot"].split()), strict=True))
+                elif match["avr"] and AVERAGE_KEYS[0] not in metrics_data:
+                    values = (match["avr"] + " " + match["avr_decompress"]).split()
+                    metrics_data.update(zip(AVERAGE_KEYS, map(float, values), strict=True))
 
             if not metrics_data:
                 raise ValueError("Unable to parse 7-Zip benchmark output")
@@ -54,10 +60,8 @@ class SevenZipBenchmark(BenchmarkBase):
             metrics = BenchmarkMetrics({})
             message = str(e)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({}),
             duration_seconds=duration,
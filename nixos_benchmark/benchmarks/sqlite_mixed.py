@@ -1,19 +1,55 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sqlite3
 import tempfile
 import time
 from pathlib import Path
-from typing import cast
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
+from ..utils import temp_data_dir
 from .base import BenchmarkBase
 from .types import BenchmarkType
 
 
 DEFAULT_SQLITE_ROWS = 100_000  # Increased from 50k for more representative testing
 DEFAULT_SQLITE_SELECTS = 2_000  # Increased from 1k
+SQLITE_VERSION = f"SQLite {sqlite3.sqlite_version}"  # The linked library cannot change within a process
+SQLITE_DB_SIZE_MB = 8  # Generous bound for the benchmark table and its index
+# The database is throwaway, so durability and locking overheads are kept out of the timings
+SQLITE_BENCHMARK_PRAGMAS = """
+PRAGMA journal_mode = MEMORY;
+PRAGMA synchronous = OFF;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -65536;
+PRAGMA locking_mode = EXCLUSIVE;
+PRAGMA mmap_size = 268435456;
+"""
+# Rows are generated inside SQLite rather than bound one by one from Python; generate_series is not in stock builds
+SQLITE_INSERT_ROWS = (
+    "WITH RECURSIVE seq(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM seq WHERE i + 1 < ?) "
+    "INSERT INTO bench(value) SELECT i % 1000 FROM seq"
+)
+# One statement sweeping every probe value, instead of a prepare/bind/step round trip per query
+SQLITE_MIXED_SELECTS = (
+    "WITH RECURSIVE seq(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM seq WHERE i + 1 < ?) "
+    "SELECT (SELECT AVG(value) FROM bench WHERE value >= i % 1000) FROM seq"
+)
+
+
+def connect_scratch_database() -> sqlite3.Connection:
+    """Open an anonymous database file that disappears when its connection closes."""
+    # On tmpfs when available, so the timings measure SQLite rather than the backing disk
+    fd, db_name = tempfile.mkstemp(suffix=".db", dir=temp_data_dir(SQLITE_DB_SIZE_MB))
+    os.close(fd)
+    db_path = Path(db_name)
+    try:
+        # Autocommit mode, so callers open their transactions explicitly
+        return sqlite3.connect(db_path, isolation_level=None)
+    finally:
+        # connect() already holds its own descriptor, so nothing is left behind even if the run dies
+        db_path.unlink()
 
 
 class SQLiteMixedBenchmark(BenchmarkBase):
@@ -21,36 +57,28 @@ class SQLiteMixedBenchmark(BenchmarkBase):
     description = "SQLite insert/select mix"
 
     def get_version(self) -> str:
-        return f"SQLite {sqlite3.sqlite_version}"
+        return SQLITE_VERSION
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         row_count = DEFAULT_SQLITE_ROWS
         select_queries = DEFAULT_SQLITE_SELECTS
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp_db:
-            db_path = Path(tmp_db.name)
         insert_start = time.perf_counter()
-        conn = sqlite3.connect(db_path)
+        conn = connect_scratch_database()
         try:
-            conn.execute("PRAGMA synchronous = OFF;")
+            conn.executescript(SQLITE_BENCHMARK_PRAGMAS)
             conn.execute("CREATE TABLE bench (id INTEGER PRIMARY KEY, value INTEGER);")
-            with conn:
-                conn.executemany(
-                    "INSERT INTO bench(value) VALUES (?)",
-                    ((i % 1000,) for i in range(row_count)),
-                )
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(SQLITE_INSERT_ROWS, (row_count,))
+            conn.execute("COMMIT")
             insert_duration = time.perf_counter() - insert_start
             query_start = time.perf_counter()
-            cursor = conn.cursor()
-            for i in range(select_queries):
-                cursor.execute("SELECT AVG(value) FROM bench WHERE value >= ?", (i % 1000,))
-                cursor.fetchone()
+            conn.execute(SQLITE_MIXED_SELECTS, (select_queries,)).fetchall()
             query_duration = time.perf_counter() - query_start
         finally:
             conn.close()
-            db_path.unlink(missing_ok=True)
 
-        metrics_data = {
+        metrics_data: dict[str, float | str | int] = {
             "insert_rows_per_s": row_count / insert_duration if insert_duration else 0.0,
             "selects_per_s": select_queries / query_duration if query_duration else 0.0,
             "row_count": row_count,
@@ -58,11 +86,9 @@ class SQLiteMixedBenchmark(BenchmarkBase):
         }
         total_duration = insert_duration + query_duration
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status="ok",
-            presets=(),
-            metrics=BenchmarkMetrics(cast(dict[str, float | str | int], metrics_data)),
+            metrics=BenchmarkMetrics(metrics_data),
             parameters=BenchmarkParameters(
                 {
                     "row_count": row_count,
@@ -1,55 +1,57 @@
 from __future__ import annotations
 
 import argparse
-import sqlite3
-import tempfile
 import time
-from pathlib import Path
-from typing import cast
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
 from .base import BenchmarkBase
-from .sqlite_mixed import DEFAULT_SQLITE_ROWS, DEFAULT_SQLITE_SELECTS
+from .sqlite_mixed import (
+    DEFAULT_SQLITE_ROWS,
+    DEFAULT_SQLITE_SELECTS,
+    SQLITE_BENCHMARK_PRAGMAS,
+    SQLITE_INSERT_ROWS,
+    SQLITE_VERSION,
+    connect_scratch_database,
+)
 from .types import BenchmarkType
 
 
+# Indexed point lookups for every probe value, swept in one statement; INDEXED BY pins the
+# covering-index plan, so COUNT(*) is answered from the index B-tree without touching table pages
+SQLITE_SPEEDTEST_SELECTS = (
+    "WITH RECURSIVE seq(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM seq WHERE i + 1 < ?) "
+    "SELECT (SELECT COUNT(*) FROM bench INDEXED BY idx_value WHERE value = i % 1000) FROM seq"
+)
+
+
 class SQLiteSpeedtestBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.SQLITE_SPEEDTEST
     description = "SQLite speedtest-style insert/select"
 
     def get_version(self) -> str:
-        return f"SQLite {sqlite3.sqlite_version}"
+        return SQLITE_VERSION
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         row_count = DEFAULT_SQLITE_ROWS
         select_queries = DEFAULT_SQLITE_SELECTS
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp_db:
-            db_path = Path(tmp_db.name)
-        conn = sqlite3.connect(db_path)
+        conn = connect_scratch_database()
         insert_start = time.perf_counter()
         try:
-            conn.execute("PRAGMA synchronous = OFF;")
-            conn.execute("PRAGMA journal_mode = MEMORY;")
+            conn.executescript(SQLITE_BENCHMARK_PRAGMAS)
             conn.execute("CREATE TABLE bench (id INTEGER PRIMARY KEY, value INTEGER);")
-            with conn:
-                conn.executemany(
-                    "INSERT INTO bench(value) VALUES (?)",
-                    ((i % 1000,) for i in range(row_count)),
-                )
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(SQLITE_INSERT_ROWS, (row_count,))
+            conn.execute("COMMIT")
             insert_duration = time.perf_counter() - insert_start
             conn.execute("CREATE INDEX idx_value ON bench(value);")
             query_start = time.perf_counter()
-            cursor = conn.cursor()
-            for i in range(select_queries):
-                cursor.execute("SELECT COUNT(*) FROM bench WHERE value = ?", (i % 1000,))
-                cursor.fetchone()
+            conn.execute(SQLITE_SPEEDTEST_SELECTS, (select_queries,)).fetchall()
             query_duration = time.perf_counter() - query_start
         finally:
             conn.close()
-            db_path.unlink(missing_ok=True)
 
-        metrics_data = {
+        metrics_data: dict[str, float | str | int] = {
             "insert_rows_per_s": row_count / insert_duration if insert_duration else 0.0,
             "indexed_selects_per_s": select_queries / query_duration if query_duration else 0.0,
             "row_count": row_count,
@@ -57,11 +59,9 @@ class SQLiteSpeedtestBenchmark(BenchmarkBase):
         }
         total_duration = insert_duration + query_duration
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status="ok",
-            presets=(),
-            metrics=BenchmarkMetrics(cast(dict[str, float | str | int], metrics_data)),
+            metrics=BenchmarkMetrics(metrics_data),
             parameters=BenchmarkParameters({"row_count": row_count, "select_queries": select_queries}),
             duration_seconds=total_duration,
             command="python-sqlite3-speedtest",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import re
 import subprocess
 
@@ -12,32 +13,44 @@ from .types import BenchmarkType
 
 DEFAULT_STOCKFISH_THREADS = 0  # 0 = auto-detect
 DEFAULT_STOCKFISH_LIMIT = 20  # seconds - increased from 10 for more stable results
+# The three bench summary lines in one alternation; each group is named after the metric it fills
+BENCH_SUMMARY_PATTERN = re.compile(
+    r"Total time \(ms\)\s*:\s*(?P<total_time_ms>[\d.]+)"
+    r"|Nodes searched\s*:\s*(?P<nodes_searched>[\d.]+)"
+    r"|Nodes/second\s*:\s*(?P<nodes_per_sec>[\d.]+)"
+)
+BENCH_SUMMARY_KEYS = ("total_time_ms", "nodes_searched", "nodes_per_sec")
+ID_NAME_PATTERN = re.compile(r"^id name[ \t]+(.+)$", re.MULTILINE | re.IGNORECASE)
+
+
+@functools.cache
+def _stockfish_version() -> str:
+    """Ask the engine for its UCI "id name" once per process."""
+    try:
+        completed = subprocess.run(
+            ["stockfish"],
+            check=False,
+            input="uci\nquit\n",
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            timeout=3,
+        )
+    except (FileNotFoundError, subprocess.SubprocessError):
+        return ""
+
+    match = ID_NAME_PATTERN.search(completed.stdout or "")
+    return match.group(1).strip() if match else ""
 
 
 class StockfishBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.STOCKFISH
     description = "Stockfish built-in bench (nodes/sec)"
     _required_commands = ("stockfish",)
+    concurrency_group = "cpu"
 
     def get_version(self) -> str:
-        try:
-            completed = subprocess.run(
-                ["stockfish"],
-                check=False,
-                input="uci\nquit\n",
-                text=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                timeout=3,
-            )
-        except (FileNotFoundError, subprocess.SubprocessError):
-            return super().get_version()
-
-        for line in (completed.stdout or "").splitlines():
-            lower = line.lower()
-            if lower.startswith("id name"):
-                return line.split(" ", 2)[2].strip()
-        return super().get_version()
+        return _stockfish_version() or super().get_version()
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         threads = DEFAULT_STOCKFISH_THREADS
@@ -55,18 +68,7 @@ class StockfishBenchmark(BenchmarkBase):
             raise subprocess.CalledProcessError(returncode, command, stdout)
 
         try:
-            total_time_ms = self._parse_value(stdout, r"Total time \(ms\)\s*:\s*([\d.]+)")
-            nodes_searched = self._parse_value(stdout, r"Nodes searched\s*:\s*([\d.]+)")
-            nodes_per_second = self._parse_value(stdout, r"Nodes/second\s*:\s*([\d.]+)")
-
-            metrics = BenchmarkMetrics(
-                {
-                    "total_time_ms": total_time_ms,
-                    "nodes_searched": nodes_searched,
-                    "nodes_per_sec": nodes_per_second,
-                    "threads": threads,
-                }
-            )
+            metrics = BenchmarkMetrics({**self._parse_summary(stdout), "threads": threads})
             status = "ok"
             message = ""
         except ValueError as exc:
@@ -74,10 +76,8 @@ class StockfishBenchmark(BenchmarkBase):
             status = "error"
             message = str(exc)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({"threads": threads, "limit_secs": limit_seconds, "hash_mb": 128}),
             duration_seconds=duration,
@@ -87,11 +87,16 @@ class StockfishBenchmark(BenchmarkBase):
         )
 
     @staticmethod
-    def _parse_value(text: str, pattern: str) -> float:
-        match = re.search(pattern, text)
-        if not match:
+    def _parse_summary(text: str) -> dict[str, float | str | int]:
+        """Collect the bench summary values in one pass, keeping the first occurrence of each."""
+        values: dict[str, float | str | int] = {}
+        for match in BENCH_SUMMARY_PATTERN.finditer(text):
+            key = match.lastgroup
+            if key is not None and key not in values:
+                values[key] = float(match[key])
+        if len(values) < len(BENCH_SUMMARY_KEYS):
             raise ValueError("Unable to parse stockfish bench output")
-        return float(match.group(1))
+        return {key: values[key] for key in BENCH_SUMMARY_KEYS}
 
     def format_result(self, result: BenchmarkResult) -> str:
         status_message = self.format_status_message(result)
@@ -12,12 +12,20 @@ from .types import BenchmarkType
 
 DEFAULT_STRESS_NG_SECONDS = 5
 DEFAULT_STRESS_NG_METHOD = "fft"
+# One --metrics-brief row: stressor, bogo ops, real/usr/sys seconds, then bogo ops/s (real and usr+sys);
+# rows start at column 0, and [ \t] keeps a match on a single line now that the whole output is scanned at once
+METRICS_PATTERN = re.compile(
+    r"^stress-ng:[ \t]+\w+:[ \t]+\[\d+\][ \t]+(\S+)[ \t]+([\d.]+)[ \t]+([\d.]+)[ \t]+([\d.]+)"
+    r"[ \t]+([\d.]+)[ \t]+([\d.]+)[ \t]+([\d.]+)",
+    re.MULTILINE,
+)
 
 
 class StressNGBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.STRESS_NG
     description = "stress-ng CPU stress test"
     _required_commands = ("stress-ng",)
+    concurrency_group = "cpu"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         seconds = DEFAULT_STRESS_NG_SECONDS
@@ -37,15 +45,8 @@ class StressNGBenchmark(BenchmarkBase):
             raise subprocess.CalledProcessError(returncode, command, stdout)
 
         try:
-            pattern = re.compile(
-                r"stress-ng:\s+\w+:\s+\[\d+\]\s+(\S+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)"
-                r"\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)"
-            )
             metrics_data = {}
-            for line in stdout.splitlines():
-                match = pattern.search(line)
-                if not match:
-                    continue
+            for match in METRICS_PATTERN.finditer(stdout):
                 stressor_name = match.group(1)
                 if stressor_name == "stressor" or stressor_name.startswith("("):
                     continue
@@ -71,10 +72,8 @@ class StressNGBenchmark(BenchmarkBase):
             metrics = BenchmarkMetrics({})
             message = str(e)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({"seconds": seconds, "cpu_method": method}),
             duration_seconds=duration,
@@ -13,12 +13,16 @@ from .types import BenchmarkType
 DEFAULT_STRESSAPPTEST_SECONDS = 5
 DEFAULT_STRESSAPPTEST_MEMORY_MB = 128
 DEFAULT_STRESSAPPTEST_THREADS = 1
+COMPLETED_PATTERN = re.compile(
+    r"Stats: Completed:\s+([\d.]+)M in ([\d.]+)s ([\d.]+)MB/s, with (\d+) hardware incidents, (\d+) errors"
+)
 
 
 class StressAppTestBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.STRESSAPPTEST
     description = "stressapptest memory bandwidth"
     _required_commands = ("stressapptest",)
+    concurrency_group = "cpu"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         seconds = DEFAULT_STRESSAPPTEST_SECONDS
@@ -39,10 +43,7 @@ class StressAppTestBenchmark(BenchmarkBase):
             raise subprocess.CalledProcessError(returncode, command, stdout)
 
         try:
-            completed = re.search(
-                r"Stats: Completed:\s+([\d.]+)M in ([\d.]+)s ([\d.]+)MB/s, with (\d+) hardware incidents, (\d+) errors",
-                stdout,
-            )
+            completed = COMPLETED_PATTERN.search(stdout)
             if not completed:
                 raise ValueError("Unable to parse stressapptest throughput")
 
@@ -68,10 +69,8 @@ class StressAppTestBenchmark(BenchmarkBase):
             status = "error"
             message = str(exc)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({"seconds": seconds, "memory_mb": memory_mb, "threads": threads}),
             duration_seconds=duration,
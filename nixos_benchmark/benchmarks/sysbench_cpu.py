@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 import argparse
-import os
 import re
 import subprocess
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
-from ..utils import run_command
+from ..utils import effective_cpu_count, run_command
 from .base import BenchmarkBase
 from .types import BenchmarkType
 
@@ -14,18 +13,25 @@ from .types import BenchmarkType
 DEFAULT_SYSBENCH_CPU_MAX_PRIME = 20000
 DEFAULT_SYSBENCH_RUNTIME = 10  # Increased from 5 for more stable results
 DEFAULT_SYSBENCH_THREADS = 0
+# Summary lines in one alternation; each group is named after the metric it fills
+SUMMARY_PATTERN = re.compile(
+    r"events per second:\s+(?P<events_per_sec>[\d.]+)"
+    r"|total time:\s+(?P<total_time_secs>[\d.]+)s"
+    r"|total number of events:\s+(?P<total_events>[\d.]+)"
+)
 
 
 class SysbenchCPUBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.SYSBENCH_CPU
     description = "sysbench CPU benchmark"
     _required_commands = ("sysbench",)
+    concurrency_group = "cpu"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         threads = DEFAULT_SYSBENCH_THREADS
         max_prime = DEFAULT_SYSBENCH_CPU_MAX_PRIME
         runtime_secs = DEFAULT_SYSBENCH_RUNTIME
-        thread_count = threads if threads > 0 else (os.cpu_count() or 1)
+        thread_count = threads if threads > 0 else effective_cpu_count()
 
         command = [
             "sysbench",
@@ -41,15 +47,10 @@ class SysbenchCPUBenchmark(BenchmarkBase):
 
         try:
             metrics_data: dict[str, float | str | int] = {}
-            events_per_sec = re.search(r"events per second:\s+([\d.]+)", stdout)
-            total_time = re.search(r"total time:\s+([\d.]+)s", stdout)
-            total_events = re.search(r"total number of events:\s+([\d.]+)", stdout)
-            if events_per_sec:
-                metrics_data["events_per_sec"] = float(events_per_sec.group(1))
-            if total_time:
-                metrics_data["total_time_secs"] = float(total_time.group(1))
-            if total_events:
-                metrics_data["total_events"] = float(total_events.group(1))
+            for match in SUMMARY_PATTERN.finditer(stdout):
+                key = match.lastgroup
+                if key is not None and key not in metrics_data:
+                    metrics_data[key] = float(match[key])
             if not metrics_data:
                 raise ValueError("Unable to parse sysbench CPU output")
 
@@ -63,10 +64,8 @@ class SysbenchCPUBenchmark(BenchmarkBase):
             metrics = BenchmarkMetrics({})
             message = str(e)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters(
                 {
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import argparse
-import os
 import re
 import subprocess
+from pathlib import Path
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
-from ..utils import run_command
+from ..utils import command_exists, effective_cpu_count, run_command
 from .base import BenchmarkBase
 from .sysbench_cpu import DEFAULT_SYSBENCH_THREADS
 from .types import BenchmarkType
@@ -15,21 +15,47 @@ from .types import BenchmarkType
 DEFAULT_SYSBENCH_MEMORY_BLOCK_KB = 1024
 DEFAULT_SYSBENCH_MEMORY_TOTAL_MB = 4096  # Increased from 512 for more accurate measurement
 DEFAULT_SYSBENCH_MEMORY_OPERATION = "read"
+THP_ENABLED_PATH = Path("/sys/kernel/mm/transparent_hugepage/enabled")
+NR_HUGEPAGES_PATH = Path("/proc/sys/vm/nr_hugepages")
+SECOND_NUMA_NODE_PATH = Path("/sys/devices/system/node/node1")
+
+
+def _hugepages_enabled() -> bool:
+    """Report whether THP is forced on or a static huge page pool is configured."""
+    try:
+        if "[always]" in THP_ENABLED_PATH.read_text(encoding="utf-8"):
+            return True
+    except OSError:
+        pass
+    try:
+        return int(NR_HUGEPAGES_PATH.read_text(encoding="utf-8").strip() or 0) > 0
+    except (OSError, ValueError):
+        return False
+
+
+def _numa_interleave_prefix() -> list[str]:
+    """Interleave allocations across nodes on multi-node hosts so throughput is not bound to one node."""
+    if SECOND_NUMA_NODE_PATH.exists() and command_exists("numactl"):
+        return ["numactl", "--interleave=all"]
+    return []
 
 
 class SysbenchMemoryBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.SYSBENCH_MEMORY
     description = "sysbench memory throughput"
     _required_commands = ("sysbench",)
+    concurrency_group = "cpu"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         threads = DEFAULT_SYSBENCH_THREADS
         block_kb = DEFAULT_SYSBENCH_MEMORY_BLOCK_KB
         total_mb = DEFAULT_SYSBENCH_MEMORY_TOTAL_MB
         operation = DEFAULT_SYSBENCH_MEMORY_OPERATION
-        thread_count = threads if threads > 0 else (os.cpu_count() or 1)
+        thread_count = threads if threads > 0 else effective_cpu_count()
 
+        numa_prefix = _numa_interleave_prefix()
         command = [
+            *numa_prefix,
             "sysbench",
             "memory",
             f"--memory-block-size={block_kb}K",
@@ -38,7 +64,8 @@ class SysbenchMemoryBenchmark(BenchmarkBase):
             f"--threads={thread_count}",
             "run",
         ]
-        stdout, duration, returncode = run_command(command)
+        # A single malloc arena keeps the buffers sysbench allocates from being spread over per-thread arenas
+        stdout, duration, returncode = run_command(command, env={"MALLOC_ARENA_MAX": "1"})
         if returncode != 0:
             raise subprocess.CalledProcessError(returncode, command, stdout)
 
@@ -62,6 +89,7 @@ class SysbenchMemoryBenchmark(BenchmarkBase):
             metrics_data["block_kb"] = block_kb
             metrics_data["total_mb"] = total_mb
             metrics_data["operation"] = operation
+            metrics_data["hugepages"] = _hugepages_enabled()
             status = "ok"
             metrics = BenchmarkMetrics(metrics_data)
             message = ""
@@ -70,10 +98,8 @@ class SysbenchMemoryBenchmark(BenchmarkBase):
             metrics = BenchmarkMetrics({})
             message = str(e)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters(
                 {
@@ -81,6 +107,7 @@ class SysbenchMemoryBenchmark(BenchmarkBase):
                     "block_kb": block_kb,
                     "total_mb": total_mb,
                     "operation": operation,
+                    "numa_interleave": bool(numa_prefix),
                 }
             ),
             duration_seconds=duration,
@@ -10,10 +10,17 @@ from .base import BenchmarkBase
 from .types import BenchmarkType
 
 
+THROUGHPUT_LINE_PATTERN = re.compile(
+    r"^[ \t]*([A-Za-z0-9 +/_-]+?)[ \t]*:?[ \t]+([\d.,]+)[ \t]+M(?:i)?B/s", flags=re.MULTILINE
+)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
 class TinyMemBenchBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.TINYMEMBENCH
     description = "TinyMemBench memory throughput"
     _required_commands = ("tinymembench",)
+    concurrency_group = "cpu"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         command = ["tinymembench"]
@@ -23,11 +30,8 @@ class TinyMemBenchBenchmark(BenchmarkBase):
 
         try:
             metrics_data: dict[str, float | str | int] = {}
-            for line in stdout.splitlines():
-                match = re.match(r"\s*([A-Za-z0-9 +/_-]+?)\s*:?\s+([\d.,]+)\s+M(?:i)?B/s", line)
-                if not match:
-                    continue
-                label = re.sub(r"\s+", "_", match.group(1).strip().lower())
+            for match in THROUGHPUT_LINE_PATTERN.finditer(stdout):
+                label = WHITESPACE_PATTERN.sub("_", match.group(1).strip().lower())
                 metrics_data[f"{label}_mb_per_s"] = parse_float(match.group(2))
 
             if not metrics_data:
@@ -41,10 +45,8 @@ class TinyMemBenchBenchmark(BenchmarkBase):
             metrics = BenchmarkMetrics({})
             message = str(e)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters({}),
             duration_seconds=duration,
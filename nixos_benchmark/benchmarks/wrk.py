@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import contextlib
 import re
 import subprocess
 import sys
@@ -9,7 +8,7 @@ import tempfile
 from pathlib import Path
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
-from ..utils import find_free_tcp_port, run_command, wait_for_port
+from ..utils import find_free_tcp_port, run_command, stop_process_group, wait_for_output
 from .base import BenchmarkBase
 from .types import BenchmarkType
 
@@ -45,6 +44,7 @@ class WrkHTTPBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.WRK_HTTP
     description = "wrk HTTP load against a local python server"
     _required_commands = ("wrk",)
+    concurrency_group = "cpu"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         duration = DEFAULT_WRK_DURATION
@@ -56,16 +56,19 @@ class WrkHTTPBenchmark(BenchmarkBase):
             tmp_path = Path(tmpdir)
             (tmp_path / "index.html").write_text("benchmark\n", encoding="utf-8")
 
+            # http.server announces itself once the socket is listening; -u keeps that line unbuffered
             server = subprocess.Popen(
-                [sys.executable, "-m", "http.server", str(port), "--bind", "127.0.0.1"],
+                [sys.executable, "-u", "-m", "http.server", str(port), "--bind", "127.0.0.1"],
                 cwd=tmp_path,
-                stdout=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
-                text=True,
+                start_new_session=True,
             )
 
-            if not wait_for_port("127.0.0.1", port):
-                server.kill()
+            if not wait_for_output(server, b"Serving HTTP"):
+                stop_process_group(server)
+                if server.stdout:
+                    server.stdout.close()
                 raise RuntimeError("HTTP server failed to start")
 
             try:
@@ -83,10 +86,9 @@ class WrkHTTPBenchmark(BenchmarkBase):
                 if returncode != 0:
                     raise subprocess.CalledProcessError(returncode, command, stdout)
             finally:
-                with contextlib.suppress(Exception):
-                    server.terminate()
-                with contextlib.suppress(Exception):
-                    server.wait(timeout=5)
+                stop_process_group(server)
+                if server.stdout:
+                    server.stdout.close()
 
         try:
             reqs_match = re.search(r"Requests/sec:\s+([\d.kKmMgG]+)", stdout)
@@ -114,10 +116,8 @@ class WrkHTTPBenchmark(BenchmarkBase):
             status = "error"
             message = str(exc)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters(
                 {
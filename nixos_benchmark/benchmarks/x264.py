@@ -3,11 +3,9 @@ from __future__ import annotations
 import argparse
 import re
 import subprocess
-import tempfile
-from pathlib import Path
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
-from ..utils import run_command
+from ..utils import generate_test_pattern, run_command_tail
 from .base import BenchmarkBase
 from .types import BenchmarkType
 
@@ -16,12 +14,15 @@ DEFAULT_X264_RESOLUTION = "1280x720"
 DEFAULT_X264_FRAMES = 600  # Increased from 240 (20s @ 30fps instead of 8s)
 DEFAULT_X264_PRESET = "medium"
 DEFAULT_X264_CRF = 23
+CPU_CAPS_PATTERN = re.compile(r"using cpu capabilities:\s*(.+)")
 
 
 class X264Benchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.X264
     description = "x264 encoder benchmark"
     _required_commands = ("x264", "ffmpeg")
+    concurrency_group = "cpu"
+    shared_input = "test_pattern"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         resolution = DEFAULT_X264_RESOLUTION
@@ -30,78 +31,57 @@ class X264Benchmark(BenchmarkBase):
         crf = DEFAULT_X264_CRF
 
         # Generate test pattern
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".y4m") as tmp:
-            pattern_path = Path(tmp.name)
+        pattern_path = generate_test_pattern(resolution, frames)
 
         command = [
-            "ffmpeg",
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-y",
-            "-f",
-            "lavfi",
-            "-i",
-            f"testsrc=size={resolution}:rate=30",
-            "-frames:v",
+            "x264",
+            "--preset",
+            preset,
+            "--crf",
+            str(crf),
+            "--frames",
             str(frames),
-            "-pix_fmt",
-            "yuv420p",
+            # Progress redraws would otherwise push the cpu capabilities line out of the output tail
+            "--no-progress",
             str(pattern_path),
+            "-o",
+            "/dev/null",
         ]
-        stdout, _, returncode = run_command(command)
+        stdout, duration, returncode = run_command_tail(command)
         if returncode != 0:
-            pattern_path.unlink(missing_ok=True)
             raise subprocess.CalledProcessError(returncode, command, stdout)
 
         try:
-            command = [
-                "x264",
-                "--preset",
-                preset,
-                "--crf",
-                str(crf),
-                "--frames",
-                str(frames),
-                str(pattern_path),
-                "-o",
-                "/dev/null",
-            ]
-            stdout, duration, returncode = run_command(command)
-            if returncode != 0:
-                raise subprocess.CalledProcessError(returncode, command, stdout)
-
-            try:
-                # Parse encoded fps and bitrate
-                metrics_data: dict[str, float | str | int] = {}
-                fps_match = re.search(
-                    r"encoded\s+\d+\s+frames,\s+([\d.]+)\s+fps,\s+([\d.]+)\s+kb/s",
-                    stdout,
-                )
-                if fps_match:
-                    metrics_data["fps"] = float(fps_match.group(1))
-                    metrics_data["kb_per_s"] = float(fps_match.group(2))
-                    metrics_data["preset"] = preset
-                    metrics_data["crf"] = crf
-                    metrics_data["resolution"] = resolution
-
-                if not metrics_data:
-                    raise ValueError("Unable to parse x264 output")
-
-                status = "ok"
-                metrics = BenchmarkMetrics(metrics_data)
-                message = ""
-            except ValueError as e:
-                status = "error"
-                metrics = BenchmarkMetrics({})
-                message = str(e)
-        finally:
-            pattern_path.unlink(missing_ok=True)
-
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+            # Parse encoded fps and bitrate
+            metrics_data: dict[str, float | str | int] = {}
+            fps_match = re.search(
+                r"encoded\s+\d+\s+frames,\s+([\d.]+)\s+fps,\s+([\d.]+)\s+kb/s",
+                stdout,
+            )
+            if fps_match:
+                metrics_data["fps"] = float(fps_match.group(1))
+                metrics_data["kb_per_s"] = float(fps_match.group(2))
+                metrics_data["preset"] = preset
+                metrics_data["crf"] = crf
+                metrics_data["resolution"] = resolution
+                # SIMD paths x264 dispatched to (e.g. AVX2, AVX512, NEON), reported when encoding starts
+                caps_match = CPU_CAPS_PATTERN.search(stdout)
+                if caps_match:
+                    metrics_data["asm"] = caps_match.group(1).strip()
+
+            if not metrics_data:
+                raise ValueError("Unable to parse x264 output")
+
+            status = "ok"
+            metrics = BenchmarkMetrics(metrics_data)
+            message = ""
+        except ValueError as e:
+            status = "error"
+            metrics = BenchmarkMetrics({})
+            message = str(e)
+
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters(
                 {
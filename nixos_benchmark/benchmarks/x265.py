@@ -3,11 +3,9 @@ from __future__ import annotations
 import argparse
 import re
 import subprocess
-import tempfile
-from pathlib import Path
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
-from ..utils import run_command
+from ..utils import generate_test_pattern, run_command_tail
 from .base import BenchmarkBase
 from .types import BenchmarkType
 
@@ -22,6 +20,8 @@ class X265Benchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.X265
     description = "x265 encoder benchmark"
     _required_commands = ("x265", "ffmpeg")
+    concurrency_group = "cpu"
+    shared_input = "test_pattern"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         resolution = DEFAULT_X265_RESOLUTION
@@ -29,80 +29,53 @@ class X265Benchmark(BenchmarkBase):
         preset = DEFAULT_X265_PRESET
         crf = DEFAULT_X265_CRF
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".y4m") as tmp:
-            pattern_path = Path(tmp.name)
+        # Synthetic input clip, shared with x264 through the user cache
+        pattern_path = generate_test_pattern(resolution, frames)
 
-        # Generate a synthetic input clip
-        gen_command = [
-            "ffmpeg",
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-y",
-            "-f",
-            "lavfi",
-            "-i",
-            f"testsrc=size={resolution}:rate=30",
-            "-frames:v",
+        command = [
+            "x265",
+            "--preset",
+            preset,
+            "--crf",
+            str(crf),
+            "--frames",
             str(frames),
-            "-pix_fmt",
-            "yuv420p",
             str(pattern_path),
+            "-o",
+            "/dev/null",
         ]
-        stdout, _, gen_rc = run_command(gen_command)
-        if gen_rc != 0:
-            pattern_path.unlink(missing_ok=True)
-            raise subprocess.CalledProcessError(gen_rc, gen_command, stdout)
+        stdout, duration, returncode = run_command_tail(command)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command, stdout)
 
         try:
-            command = [
-                "x265",
-                "--preset",
-                preset,
-                "--crf",
-                str(crf),
-                "--frames",
-                str(frames),
-                str(pattern_path),
-                "-o",
-                "/dev/null",
-            ]
-            stdout, duration, returncode = run_command(command)
-            if returncode != 0:
-                raise subprocess.CalledProcessError(returncode, command, stdout)
+            match = re.search(
+                r"encoded\s+\d+\s+frames\s+in\s+([\d.]+)s\s+\(([\d.]+)\s+fps\)",
+                stdout,
+            )
+            if not match:
+                raise ValueError("Unable to parse x265 output")
+            elapsed = float(match.group(1))
+            fps = float(match.group(2))
 
-            try:
-                match = re.search(
-                    r"encoded\s+\d+\s+frames\s+in\s+([\d.]+)s\s+\(([\d.]+)\s+fps\)",
-                    stdout,
-                )
-                if not match:
-                    raise ValueError("Unable to parse x265 output")
-                elapsed = float(match.group(1))
-                fps = float(match.group(2))
-
-                metrics = BenchmarkMetrics(
-                    {
-                        "fps": fps,
-                        "encode_time_secs": elapsed,
-                        "preset": preset,
-                        "crf": crf,
-                        "resolution": resolution,
-                    }
-                )
-                status = "ok"
-                message = ""
-            except ValueError as exc:
-                metrics = BenchmarkMetrics({})
-                status = "error"
-                message = str(exc)
-        finally:
-            pattern_path.unlink(missing_ok=True)
+            metrics = BenchmarkMetrics(
+                {
+                    "fps": fps,
+                    "encode_time_secs": elapsed,
+                    "preset": preset,
+                    "crf": crf,
+                    "resolution": resolution,
+                }
+            )
+            status = "ok"
+            message = ""
+        except ValueError as exc:
+            metrics = BenchmarkMetrics({})
+            status = "error"
+            message = str(exc)
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status=status,
-            presets=(),
             metrics=metrics,
             parameters=BenchmarkParameters(
                 {
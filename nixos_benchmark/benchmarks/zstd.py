@@ -3,10 +3,9 @@ from __future__ import annotations
 import argparse
 import subprocess
 import time
-from typing import cast
 
 from ..models import BenchmarkMetrics, BenchmarkParameters, BenchmarkResult
-from ..utils import run_command, write_temp_data_file
+from ..utils import run_command, shared_data_file
 from .base import BenchmarkBase
 from .types import BenchmarkType
 
@@ -19,11 +18,14 @@ class ZstdBenchmark(BenchmarkBase):
     benchmark_type = BenchmarkType.ZSTD
     description = "zstd compress/decompress throughput"
     _required_commands = ("zstd",)
+    concurrency_group = "cpu"
+    shared_input = "compression_data"
 
     def execute(self, args: argparse.Namespace) -> BenchmarkResult:
         level = DEFAULT_ZSTD_LEVEL
         size_mb = DEFAULT_COMPRESS_SIZE_MB
-        data_path = write_temp_data_file(size_mb)
+        # Shared with pigz, so the input is generated once per run and left in place
+        data_path = shared_data_file(size_mb)
         compressed_path = data_path.with_suffix(data_path.suffix + ".zst")
         decompressed_path = data_path.with_suffix(".out")
 
@@ -43,7 +45,6 @@ class ZstdBenchmark(BenchmarkBase):
                 raise subprocess.CalledProcessError(returncode, compress_command, stdout)
             compress_duration = time.perf_counter() - start
 
-            data_path.unlink(missing_ok=True)
             start = time.perf_counter()
             decompress_command = [
                 "zstd",
@@ -59,22 +60,19 @@ class ZstdBenchmark(BenchmarkBase):
                 raise subprocess.CalledProcessError(returncode, decompress_command, stdout)
             decompress_duration = time.perf_counter() - start
         finally:
-            data_path.unlink(missing_ok=True)
             compressed_path.unlink(missing_ok=True)
             decompressed_path.unlink(missing_ok=True)
 
-        metrics_data = {
+        metrics_data: dict[str, float | str | int] = {
             "compress_mb_per_s": size_mb / compress_duration if compress_duration else 0.0,
             "decompress_mb_per_s": size_mb / decompress_duration if decompress_duration else 0.0,
             "level": level,
             "size_mb": size_mb,
         }
 
-        return BenchmarkResult(
-            benchmark_type=self.benchmark_type,
+        return self.build_result(
             status="ok",
-            presets=(),
-            metrics=BenchmarkMetrics(cast(dict[str, float | str | int], metrics_data)),
+            metrics=BenchmarkMetrics(metrics_data),
             parameters=BenchmarkParameters({"level": level, "size_mb": size_mb}),
             duration_seconds=compress_duration + decompress_duration,
             command=self.format_command(compress_command),
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
 import subprocess
 import sys
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from time import perf_counter, sleep
@@ -19,6 +21,8 @@ from .benchmarks import (
     get_presets_for_benchmark,
 )
 from .benchmarks.base import BenchmarkBase
+from .benchmarks.ffmpeg import DEFAULT_FFMPEG_CODEC
+from .benchmarks.openssl import DEFAULT_OPENSSL_ALGORITHM
 from .models import (
     BenchmarkMetrics,
     BenchmarkParameters,
@@ -32,6 +36,7 @@ from .output import (
 )
 from .system_checks import check_system_environment, print_system_warnings
 from .system_info import gather_system_info
+from .utils import SHARED_INPUT_RELEASERS
 
 
 class CommaSeparatedListAction(argparse.Action):
@@ -59,6 +64,8 @@ class CommaSeparatedListAction(argparse.Action):
 
 T = TypeVar("T")
 
+MAX_CONCURRENT_BENCHMARKS = 2
+
 
 def unique_ordered(values: Sequence[T]) -> list[T]:  # noqa: UP047
     """Return unique values in order."""
@@ -145,6 +152,29 @@ def build_argument_parser() -> argparse.ArgumentParser:
         default="offscreen",
         help="Rendering mode for glmark2 (offscreen avoids taking over the display).",
     )
+    parser.add_argument(
+        "--ffmpeg-codec",
+        default=DEFAULT_FFMPEG_CODEC,
+        metavar="CODEC",
+        help=f"ffmpeg-transcode encoder; 'auto' prefers NVENC, VAAPI, then QSV (default: {DEFAULT_FFMPEG_CODEC}).",
+    )
+    parser.add_argument(
+        "--openssl-algorithm",
+        default=DEFAULT_OPENSSL_ALGORITHM,
+        metavar="CIPHER",
+        help=f"EVP cipher for openssl-speed, e.g. aes-256-cbc for serial mode (default: {DEFAULT_OPENSSL_ALGORITHM}).",
+    )
+    parser.add_argument(
+        "--fio-directory",
+        default="/var/tmp",
+        metavar="PATH",
+        help="Directory holding the fio test file; pick one on the device you want to measure (default: /var/tmp).",
+    )
+    parser.add_argument(
+        "--fio-mixed",
+        action="store_true",
+        help="Run fio as one 50/50 read/write job; reported as mixread/mixwrite metrics, which are not scored.",
+    )
     parser.add_argument(
         "--wait-between",
         type=int,
@@ -152,6 +182,11 @@ def build_argument_parser() -> argparse.ArgumentParser:
         metavar="SECONDS",
         help="Wait time between benchmark runs in seconds (default: 5).",
     )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Run benchmarks that load different devices (CPU/memory, disk, GPU) side by side in pairs.",
+    )
     return parser
 
 
@@ -205,21 +240,64 @@ def resolve_selected_benchmarks(args: argparse.Namespace, requested_presets: lis
     return expand_presets(requested_presets)
 
 
+def plan_benchmark_batches(
+    selected_benchmarks: Sequence[BenchmarkType], *, concurrent: bool
+) -> list[list[BenchmarkType]]:
+    """Group benchmarks into batches; members of a batch load different devices and may run together."""
+    batches: list[list[BenchmarkType]] = []
+    for benchmark_type in selected_benchmarks:
+        group = BENCHMARK_MAP[benchmark_type].concurrency_group
+        if concurrent and group is not None:
+            for batch in batches:
+                groups = [BENCHMARK_MAP[member].concurrency_group for member in batch]
+                if len(batch) < MAX_CONCURRENT_BENCHMARKS and None not in groups and group not in groups:
+                    batch.append(benchmark_type)
+                    break
+            else:
+                batches.append([benchmark_type])
+            continue
+        batches.append([benchmark_type])
+    return batches
+
+
+def run_benchmark_with_log(
+    benchmark_type: BenchmarkType, args: argparse.Namespace
+) -> tuple[BenchmarkResult, BenchmarkBase]:
+    """Execute one benchmark, printing progress lines around it."""
+    print(f"Executing {benchmark_type.value}")
+    benchmark = BENCHMARK_MAP[benchmark_type]
+    start_time = perf_counter()
+    result = execute_benchmark(benchmark, args)
+    elapsed_seconds = result.duration_seconds or perf_counter() - start_time
+    status_note = "" if result.status == "ok" else f" ({result.status})"
+    print(f"Finished {benchmark_type.value} in {elapsed_seconds:.2f}s{status_note}")
+    return result, benchmark
+
+
+def release_finished_inputs(batch: Sequence[BenchmarkType], later_batches: Sequence[Sequence[BenchmarkType]]) -> None:
+    """Free shared scratch inputs that no later benchmark reads, so they do not skew the memory benchmarks."""
+    still_needed = {BENCHMARK_MAP[member].shared_input for later in later_batches for member in later}
+    for benchmark_type in batch:
+        shared_input = BENCHMARK_MAP[benchmark_type].shared_input
+        if shared_input is not None and shared_input not in still_needed:
+            SHARED_INPUT_RELEASERS[shared_input]()
+
+
 def run_selected_benchmarks(selected_benchmarks: Sequence[BenchmarkType], args: argparse.Namespace):
     """Execute benchmarks and keep their instances alongside results."""
     results_with_benchmarks: list[tuple[BenchmarkResult, BenchmarkBase]] = []
-    for i, benchmark_type in enumerate(selected_benchmarks):
-        print(f"Executing {benchmark_type.value}")
-        benchmark = BENCHMARK_MAP[benchmark_type]
-        start_time = perf_counter()
-        result = execute_benchmark(benchmark, args)
-        elapsed_seconds = result.duration_seconds or perf_counter() - start_time
-        status_note = "" if result.status == "ok" else f" ({result.status})"
-        print(f"Finished {benchmark_type.value} in {elapsed_seconds:.2f}s{status_note}")
-        results_with_benchmarks.append((result, benchmark))
+    batches = plan_benchmark_batches(selected_benchmarks, concurrent=args.concurrent)
+    for i, batch in enumerate(batches):
+        if len(batch) == 1:
+            results_with_benchmarks.append(run_benchmark_with_log(batch[0], args))
+        else:
+            with ThreadPoolExecutor(max_workers=len(batch)) as pool:
+                futures = [pool.submit(run_benchmark_with_log, benchmark_type, args) for benchmark_type in batch]
+                results_with_benchmarks.extend(future.result() for future in futures)
+        release_finished_inputs(batch, batches[i + 1 :])
 
         # Wait between benchmarks if not the last one
-        if i < len(selected_benchmarks) - 1 and args.wait_between > 0:
+        if i < len(batches) - 1 and args.wait_between > 0:
             print(f"Waiting {args.wait_between} seconds before next benchmark...")
             sleep(args.wait_between)
     return results_with_benchmarks
@@ -314,18 +392,7 @@ def execute_benchmark(benchmark, args: argparse.Namespace) -> BenchmarkResult:
         )
 
     # Update result with presets from benchmark instance
-    return BenchmarkResult(
-        benchmark_type=result.benchmark_type,
-        status=result.status,
-        presets=benchmark_presets,
-        metrics=result.metrics,
-        parameters=result.parameters,
-        duration_seconds=result.duration_seconds,
-        command=result.command,
-        message=result.message,
-        raw_output=result.raw_output,
-        version=result.version or benchmark_version,
-    )
+    return dataclasses.replace(result, presets=benchmark_presets, version=result.version or benchmark_version)
 
 
 def main() -> int:
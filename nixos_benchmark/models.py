@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from .benchmarks import BenchmarkType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BenchmarkMetrics:
     """Type-safe container for benchmark-specific metrics."""
 
@@ -28,7 +28,7 @@ class BenchmarkMetrics:
         return self.data.copy()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BenchmarkParameters:
     """Type-safe container for benchmark parameters."""
 
@@ -45,7 +45,7 @@ class BenchmarkParameters:
         return self.data.copy()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BenchmarkResult:
     """Complete benchmark result - use throughout entire lifecycle."""
 
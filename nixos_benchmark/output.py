@@ -187,9 +187,9 @@ def _load_reports_and_metadata(
 
     for path in json_files:
         try:
-            raw = path.read_text()
-            data: dict[str, Any] = json.loads(raw)
-        except (json.JSONDecodeError, OSError):
+            # Decode straight from bytes; json detects UTF-8 itself and skips a text-mode decode pass
+            data: dict[str, Any] = json.loads(path.read_bytes())
+        except (ValueError, OSError):
             continue
 
         presets_raw = data.get("presets_requested", []) or []
@@ -2,24 +2,134 @@
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import functools
 import os
+import re
+import select
 import shutil
+import signal
 import socket
 import subprocess
 import tempfile
+import threading
 import time
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Callable, Sequence
 from pathlib import Path
 
 
+LINE_BREAK_PATTERN = re.compile(rb"[\r\n]+")
+DEFAULT_TAIL_LINES = 512
+# How long a server gets to exit after SIGTERM before its process group is killed
+DEFAULT_STOP_GRACE_SECONDS = 2.0
+# Lists the P-cores on hybrid Intel parts; absent on homogeneous CPUs
+PERFORMANCE_CORES_PATH = Path("/sys/devices/cpu_core/cpus")
+
+
 def parse_float(token: str) -> float:
     """Parse float, handling European decimal separator."""
     return float(token.replace(",", "."))
 
 
+@functools.cache
+def _load_path_index() -> dict[str, str]:
+    """Index executables on PATH once instead of stat-ing every directory per lookup."""
+    # Built locally and published by the cache only once complete, so concurrent callers never see a partial index
+    index: dict[str, str] = {}
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    if entry.name in index:
+                        continue
+                    try:
+                        if entry.is_file() and os.access(entry.path, os.X_OK):
+                            index[entry.name] = entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return index
+
+
+def find_command(command: str) -> str | None:
+    """Return the absolute path of a command found in PATH."""
+    if os.sep in command:
+        return shutil.which(command)
+    return _load_path_index().get(command)
+
+
+@functools.cache
 def command_exists(command: str) -> bool:
-    """Check if a command exists in PATH."""
-    return shutil.which(command) is not None
+    """Check if a command exists in PATH, answering repeated checks from memory."""
+    return find_command(command) is not None
+
+
+@functools.cache
+def cpu_flags() -> frozenset[str]:
+    """CPU feature flags from /proc/cpuinfo ("flags" on x86, "Features" on ARM)."""
+    try:
+        with Path("/proc/cpuinfo").open(encoding="utf-8") as handle:
+            for line in handle:
+                key, _, value = line.partition(":")
+                if key.strip() in ("flags", "Features"):
+                    return frozenset(value.split())
+    except OSError:
+        pass
+    return frozenset()
+
+
+@functools.cache
+def effective_cpu_count() -> int:
+    """CPUs this process may actually use, honouring affinity masks and a cgroup v2 CPU quota."""
+    count = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text(encoding="utf-8").split()[:2]
+        if quota != "max":
+            count = min(count, max(1, -(-int(quota) // int(period))))
+    except (OSError, ValueError):
+        pass
+    return max(count, 1)
+
+
+def _parse_cpu_list(text: str) -> set[int]:
+    """Expand a kernel CPU list such as "0-7,16" into CPU numbers."""
+    cpus: set[int] = set()
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+@functools.cache
+def performance_cpus() -> tuple[int, ...]:
+    """CPUs this process may use, narrowed to the performance cores on hybrid (P/E) parts."""
+    usable = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else set(range(os.cpu_count() or 1))
+    try:
+        cores = _parse_cpu_list(PERFORMANCE_CORES_PATH.read_text(encoding="utf-8")) & usable
+    except (OSError, ValueError):
+        cores = set()
+    return tuple(sorted(cores or usable))
+
+
+def pin_command(command: Sequence[str], cpus: Sequence[int]) -> list[str]:
+    """Prefix a command with taskset so it stays on ``cpus``; returned unchanged when taskset is missing."""
+    if not cpus or not command_exists("taskset"):
+        return list(command)
+    return ["taskset", "--cpu-list", ",".join(map(str, cpus)), *command]
+
+
+def pick_command(base: str, variants: Sequence[tuple[str, str]]) -> str:
+    """Prefer the first ``(command, cpu_flag)`` variant on PATH whose flag this CPU has, else ``base``."""
+    flags = cpu_flags()
+    for command, flag in variants:
+        if flag in flags and command_exists(command):
+            return command
+    return base
 
 
 def check_requirements(commands: Sequence[str]) -> tuple[bool, str]:
@@ -30,10 +140,8 @@ def check_requirements(commands: Sequence[str]) -> tuple[bool, str]:
     return True, ""
 
 
-def run_command(command: list[str], *, env: dict[str, str] | None = None) -> tuple[str, float, int]:
-    """Run a command and return its output, duration, and return code."""
-    start = time.perf_counter()
-
+def command_env(env: dict[str, str] | None = None) -> dict[str, str]:
+    """Build the environment for a benchmark child process."""
     # Force English locale to ensure parseable output
     run_env = os.environ.copy()
     run_env["LC_ALL"] = "C"
@@ -42,24 +150,78 @@ def run_command(command: list[str], *, env: dict[str, str] | None = None) -> tup
     # Merge any additional environment variables
     if env:
         run_env.update(env)
+    return run_env
+
+
+def run_command(
+    command: list[str],
+    *,
+    env: dict[str, str] | None = None,
+    stdin_text: str | None = None,
+    capture_stdout: bool = True,
+) -> tuple[str, float, int]:
+    """Run a command and return its output, duration, and return code.
 
+    With ``capture_stdout=False`` stdout goes to /dev/null and only stderr is returned.
+    """
+    start = time.perf_counter()
     completed = subprocess.run(
         command,
+        executable=find_command(command[0]),
         check=False,
+        stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+        stderr=subprocess.STDOUT if capture_stdout else subprocess.PIPE,
+        env=command_env(env),
+        input=stdin_text.encode() if stdin_text is not None else None,
+    )
+    duration = time.perf_counter() - start
+    # Decode once here instead of text=True, which also runs two newline-translation passes and
+    # aborts on the first invalid byte; every parser is indifferent to "\r" line endings.
+    output = completed.stdout if capture_stdout else completed.stderr
+    return output.decode("utf-8", errors="replace"), duration, completed.returncode
+
+
+def run_command_tail(
+    command: list[str], *, env: dict[str, str] | None = None, max_lines: int = DEFAULT_TAIL_LINES
+) -> tuple[str, float, int]:
+    """Run a command keeping only the last ``max_lines`` lines of its output.
+
+    Carriage-return progress redraws count as lines, so long encodes stay bounded in memory.
+    """
+    start = time.perf_counter()
+    tail: deque[str] = deque(maxlen=max_lines)
+    pending = b""
+    with subprocess.Popen(
+        command,
+        executable=find_command(command[0]),
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        env=run_env,
-    )
+        env=command_env(env),
+    ) as process:
+        if process.stdout is not None:
+            while chunk := os.read(process.stdout.fileno(), 65536):
+                lines = LINE_BREAK_PATTERN.split(pending + chunk)
+                pending = lines.pop()
+                tail.extend(line.decode("utf-8", errors="replace") for line in lines if line)
+        returncode = process.wait()
+    if pending:
+        tail.append(pending.decode("utf-8", errors="replace"))
     duration = time.perf_counter() - start
-    return completed.stdout, duration, completed.returncode
+    return "\n".join(tail), duration, returncode
 
 
 def read_command_version(command: Sequence[str]) -> str:
     """Run a version-like command and return the first line of output."""
+    return _read_command_version(tuple(command))
+
+
+@functools.cache
+def _read_command_version(command: tuple[str, ...]) -> str:
+    """Probe a tool version once per process; tool versions do not change mid-run."""
     try:
         completed = subprocess.run(
             list(command),
+            executable=find_command(command[0]),
             check=False,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
@@ -81,18 +243,121 @@ def read_command_version(command: Sequence[str]) -> str:
     return " ".join(first_line.split())
 
 
+SHM_DIR = Path("/dev/shm")
+
+
+def temp_data_dir(size_mb: int) -> str | None:
+    """Prefer tmpfs for benchmark scratch files so their I/O does not hit the disk; None means the default."""
+    try:
+        stats = os.statvfs(SHM_DIR)
+    except OSError:
+        return None
+    # Leave headroom so the input never exhausts shared memory
+    if not os.access(SHM_DIR, os.W_OK) or stats.f_bavail * stats.f_frsize < 2 * size_mb * 1024 * 1024:
+        return None
+    return str(SHM_DIR)
+
+
 def write_temp_data_file(size_mb: int, randomize: bool = True) -> Path:
-    """Create a temporary file with random or zero data."""
+    """Create a temporary file with random or zero data, on /dev/shm when it has room."""
     block_size = 1024 * 1024
-    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+    with tempfile.NamedTemporaryFile(delete=False, dir=temp_data_dir(size_mb)) as tmp:
         pattern_path = Path(tmp.name)
     with pattern_path.open("wb") as handle:
+        if not randomize and hasattr(os, "posix_fallocate"):
+            # Allocated extents read back as zeros, so nothing needs to be written
+            try:
+                os.posix_fallocate(handle.fileno(), 0, size_mb * block_size)
+                return pattern_path
+            except OSError:
+                pass
         for _ in range(size_mb):
             block = os.urandom(block_size) if randomize else b"\0" * block_size
             handle.write(block)
     return pattern_path
 
 
+_SHARED_DATA_FILES: dict[int, Path] = {}
+_SHARED_DATA_LOCK = threading.Lock()
+
+
+def shared_data_file(size_mb: int) -> Path:
+    """Return a random data file kept until ``release_shared_data_files``; callers must not modify it."""
+    with _SHARED_DATA_LOCK:
+        path = _SHARED_DATA_FILES.get(size_mb)
+        if path is None or not path.exists():
+            path = write_temp_data_file(size_mb)
+            _SHARED_DATA_FILES[size_mb] = path
+            atexit.register(path.unlink, missing_ok=True)
+        return path
+
+
+def release_shared_data_files() -> None:
+    """Delete the shared compression inputs so later benchmarks do not run with their tmpfs space pinned."""
+    with _SHARED_DATA_LOCK:
+        for path in _SHARED_DATA_FILES.values():
+            path.unlink(missing_ok=True)
+        _SHARED_DATA_FILES.clear()
+
+
+_TEST_PATTERNS: dict[tuple[str, int], Path] = {}
+_TEST_PATTERN_LOCK = threading.Lock()
+
+
+def generate_test_pattern(resolution: str, frames: int) -> Path:
+    """Return a y4m testsrc clip generated once and kept until ``release_test_patterns``; callers must not modify it."""
+    with _TEST_PATTERN_LOCK:
+        path = _TEST_PATTERNS.get((resolution, frames))
+        if path is not None and path.exists():
+            return path
+
+        # Raw yuv420p is 1.5 bytes per pixel; keep the clip on tmpfs so encodes do not read from disk
+        width, _, height = resolution.partition("x")
+        size_mb = -(-int(width) * int(height) * 3 // 2 * frames // (1024 * 1024))
+        with tempfile.NamedTemporaryFile(suffix=".y4m", delete=False, dir=temp_data_dir(size_mb)) as tmp:
+            path = Path(tmp.name)
+        atexit.register(path.unlink, missing_ok=True)
+        command = [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-y",
+            "-f",
+            "lavfi",
+            "-i",
+            f"testsrc=size={resolution}:rate=30",
+            "-frames:v",
+            str(frames),
+            "-pix_fmt",
+            "yuv420p",
+            "-f",
+            "yuv4mpegpipe",
+            str(path),
+        ]
+        stdout, _, returncode = run_command(command)
+        if returncode != 0:
+            path.unlink(missing_ok=True)
+            raise subprocess.CalledProcessError(returncode, command, stdout)
+        _TEST_PATTERNS[resolution, frames] = path
+        return path
+
+
+def release_test_patterns() -> None:
+    """Delete the generated test clips so later benchmarks do not run with their tmpfs space pinned."""
+    with _TEST_PATTERN_LOCK:
+        for path in _TEST_PATTERNS.values():
+            path.unlink(missing_ok=True)
+        _TEST_PATTERNS.clear()
+
+
+# Scratch inputs shared by several benchmarks, keyed by BenchmarkBase.shared_input; released after their last user
+SHARED_INPUT_RELEASERS: dict[str, Callable[[], None]] = {
+    "compression_data": release_shared_data_files,
+    "test_pattern": release_test_patterns,
+}
+
+
 def find_free_tcp_port() -> int:
     """Find a free TCP port on localhost."""
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
@@ -101,29 +366,76 @@ def find_free_tcp_port() -> int:
 
 
 def wait_for_port(host: str, port: int, timeout: float = 5.0) -> bool:
-    """Wait for a TCP port to become available."""
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(0.5)
-            try:
-                sock.connect((host, port))
+    """Wait for a TCP port to accept connections, backing off from 0.5ms up to 10ms between attempts."""
+    deadline = time.monotonic() + timeout
+    delay = 0.0005
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=0.05):
                 return True
-            except OSError:
-                time.sleep(0.05)
-    return False
+        except OSError:
+            if time.monotonic() + delay > deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, 0.01)
+
+
+def wait_for_output(process: subprocess.Popen, marker: bytes, timeout: float = 5.0) -> bool:
+    """Block until a child prints a readiness marker on its stdout pipe, or time out."""
+    if process.stdout is None:
+        return False
+    fd = process.stdout.fileno()
+    deadline = time.monotonic() + timeout
+    seen = b""
+    while marker not in seen:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            return False
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            return False
+        seen += chunk
+    return True
 
 
+def stop_process_group(process: subprocess.Popen, grace: float = DEFAULT_STOP_GRACE_SECONDS) -> None:
+    """Stop a server spawned with ``start_new_session=True``, escalating to SIGKILL after ``grace`` seconds."""
+    # A pidfd becomes readable the moment the process exits, so the grace period needs no polling
+    pidfd = None
+    if process.poll() is None and hasattr(os, "pidfd_open"):
+        with contextlib.suppress(OSError):
+            pidfd = os.pidfd_open(process.pid)
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(process.pid, signal.SIGTERM)
+    if pidfd is not None:
+        try:
+            select.select([pidfd], [], [], grace)
+        finally:
+            os.close(pidfd)
+    else:
+        deadline = time.monotonic() + grace
+        while process.poll() is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+    if process.poll() is None:
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+
+@functools.cache
 def find_first_block_device() -> str | None:
-    """Find the first suitable block device for benchmarking."""
+    """Find the first suitable block device for benchmarking (scanned once per process)."""
     skip_prefixes = ("loop", "ram", "dm-", "zd", "nbd", "sr", "md")
-    sys_block = Path("/sys/block")
-    if not sys_block.exists():
+    # Filter on the bare entry names before building any paths
+    try:
+        with os.scandir("/sys/block") as entries:
+            names = sorted(entry.name for entry in entries if not entry.name.startswith(skip_prefixes))
+    except OSError:
         return None
-    for path in sorted(sys_block.iterdir()):
-        name = path.name
-        if name.startswith(skip_prefixes):
-            continue
+    for name in names:
         device = Path("/dev") / name
         if device.exists():
             return str(device)